@@ -76,12 +76,22 @@ def get_dynamic_max_processes(task_count):
 
 DEFAULT_MAX_PROCESSES = _get_default_max_processes()
 
+# 字幕烧录（ffmpeg）并发数默认值，由管理器调度，与工作进程数无关
+DEFAULT_MAX_FFMPEG_JOBS = DEFAULT_MAX_PROCESSES
+
 # API重试配置默认值
 DEFAULT_MAX_RETRIES = 3  # 最大重试次数
 DEFAULT_RETRY_BASE_DELAY = 1.0  # 基础延迟时间（秒）
 DEFAULT_RETRY_MAX_DELAY = 60.0  # 最大延迟时间（秒）
 DEFAULT_ENABLE_GOOGLE_FALLBACK = True  # 是否启用 Google 翻译降级
 
+# OpenAI Batch API 配置默认值（费用约为常规请求的一半，但最长可能需要 24 小时才能完成，默认关闭）
+DEFAULT_OPENAI_USE_BATCH_API = False
+DEFAULT_OPENAI_BATCH_API_MIN_ENTRIES = 200  # 字幕条目数达到该值时才使用 Batch API
+
+# Parakeet 权重量化位数（0 表示不量化；4/8 可减少模型内存并加快推理，但可能影响识别准确率，默认关闭）
+DEFAULT_PARAKEET_QUANTIZE_BITS = 0
+
 # 视频处理配置默认值
 DEFAULT_SKIP_SUBTITLE_BURNING = False  # 是否跳过字幕烧录到视频
 DEFAULT_SKIP_TRANSLATION = False  # 是否跳过字幕翻译（只导出 _en.txt），默认勾选
@@ -92,6 +102,13 @@ RETRY_BASE_DELAY = DEFAULT_RETRY_BASE_DELAY
 RETRY_MAX_DELAY = DEFAULT_RETRY_MAX_DELAY
 ENABLE_GOOGLE_FALLBACK = DEFAULT_ENABLE_GOOGLE_FALLBACK
 
+# 当前 Batch API 参数，会被load_config修改
+OPENAI_USE_BATCH_API = DEFAULT_OPENAI_USE_BATCH_API
+OPENAI_BATCH_API_MIN_ENTRIES = DEFAULT_OPENAI_BATCH_API_MIN_ENTRIES
+
+# 当前 Parakeet 量化参数，会被load_config修改
+PARAKEET_QUANTIZE_BITS = DEFAULT_PARAKEET_QUANTIZE_BITS
+
 # 当前视频处理参数，会被load_config修改
 SKIP_SUBTITLE_BURNING = DEFAULT_SKIP_SUBTITLE_BURNING
 SKIP_TRANSLATION = DEFAULT_SKIP_TRANSLATION
@@ -102,6 +119,7 @@ OPENAI_MAX_ENTRIES_PER_BATCH = DEFAULT_MAX_ENTRIES_PER_BATCH
 
 # 当前多进程参数，会被load_config修改
 MAX_PROCESSES = DEFAULT_MAX_PROCESSES
+MAX_FFMPEG_JOBS = DEFAULT_MAX_FFMPEG_JOBS
 
 # 原始默认prompt，不会被load_config修改
 DEFAULT_CUSTOM_PROMPT = """You are a professional Chinese native translator who needs to fluently translate text into Chinese.
@@ -110,11 +128,11 @@ DEFAULT_CUSTOM_PROMPT = """You are a professional Chinese native translator who
 1. Output only the translated content, without explanations or additional content (such as "Here's the translation:" or "Translation as follows:")
 2. The returned translation must maintain exactly the same number of paragraphs and format as the original text
 3. For content that should not be translated (such as proper nouns, code, etc.), keep the original text.
-4. If input contains %%, use %% in your output, if input has no %%, don't use %% in your output
+4. Never merge, split, reorder or drop lines
 
 ## OUTPUT FORMAT:
-- **Single paragraph input** → Output translation directly (no separators, no extra text)
-- **Multi-paragraph input** → Use %% as paragraph separator between translations"""
+- **Single paragraph input** → Output translation directly (no extra text)
+- **Multi-line input** (a JSON object {"lines": [...]}) → Return only a JSON object {"translations": [...]} with one translated string per line, in the same order"""
 
 # 当前使用的prompt，会被load_config修改
 OPENAI_CUSTOM_PROMPT = DEFAULT_CUSTOM_PROMPT
@@ -127,9 +145,11 @@ CONFIG_FILE = os.path.join(CONFIG_DIR, "config.json")
 def load_config():
     """Load configuration from file"""
     global OPENAI_BASE_URL, OPENAI_API_KEY, OPENAI_MODEL, OPENAI_CUSTOM_PROMPT
-    global OPENAI_MAX_CHARS_PER_BATCH, OPENAI_MAX_ENTRIES_PER_BATCH, MAX_PROCESSES
+    global OPENAI_MAX_CHARS_PER_BATCH, OPENAI_MAX_ENTRIES_PER_BATCH, MAX_PROCESSES, MAX_FFMPEG_JOBS
     global MAX_RETRIES, RETRY_BASE_DELAY, RETRY_MAX_DELAY, ENABLE_GOOGLE_FALLBACK
     global SKIP_SUBTITLE_BURNING, SKIP_TRANSLATION
+    global OPENAI_USE_BATCH_API, OPENAI_BATCH_API_MIN_ENTRIES
+    global PARAKEET_QUANTIZE_BITS
 
     # Create config directory if it doesn't exist
     if not os.path.exists(CONFIG_DIR):
@@ -147,11 +167,15 @@ def load_config():
                 OPENAI_MAX_CHARS_PER_BATCH = config.get("max_chars_per_batch", DEFAULT_MAX_CHARS_PER_BATCH)
                 OPENAI_MAX_ENTRIES_PER_BATCH = config.get("max_entries_per_batch", DEFAULT_MAX_ENTRIES_PER_BATCH)
                 MAX_PROCESSES = config.get("max_processes", DEFAULT_MAX_PROCESSES)
+                MAX_FFMPEG_JOBS = config.get("max_ffmpeg_jobs", DEFAULT_MAX_FFMPEG_JOBS)
                 # 新增重试配置
                 MAX_RETRIES = config.get("max_retries", DEFAULT_MAX_RETRIES)
                 RETRY_BASE_DELAY = config.get("retry_base_delay", DEFAULT_RETRY_BASE_DELAY)
                 RETRY_MAX_DELAY = config.get("retry_max_delay", DEFAULT_RETRY_MAX_DELAY)
                 ENABLE_GOOGLE_FALLBACK = config.get("enable_google_fallback", DEFAULT_ENABLE_GOOGLE_FALLBACK)
+                OPENAI_USE_BATCH_API = config.get("use_batch_api", DEFAULT_OPENAI_USE_BATCH_API)
+                OPENAI_BATCH_API_MIN_ENTRIES = config.get("batch_api_min_entries", DEFAULT_OPENAI_BATCH_API_MIN_ENTRIES)
+                PARAKEET_QUANTIZE_BITS = config.get("parakeet_quantize_bits", DEFAULT_PARAKEET_QUANTIZE_BITS)
                 # 新增视频处理配置
                 SKIP_SUBTITLE_BURNING = config.get("skip_subtitle_burning", DEFAULT_SKIP_SUBTITLE_BURNING)
                 SKIP_TRANSLATION = config.get("skip_translation", DEFAULT_SKIP_TRANSLATION)
@@ -159,12 +183,14 @@ def load_config():
             print(f"Error loading config: {e}")
 
 
-def save_config(base_url, api_key, model=None, custom_prompt=None, max_chars_per_batch=None, max_entries_per_batch=None, max_processes=None, max_retries=None, retry_base_delay=None, retry_max_delay=None, enable_google_fallback=None, skip_subtitle_burning=None, skip_translation=None):
+def save_config(base_url, api_key, model=None, custom_prompt=None, max_chars_per_batch=None, max_entries_per_batch=None, max_processes=None, max_retries=None, retry_base_delay=None, retry_max_delay=None, enable_google_fallback=None, skip_subtitle_burning=None, skip_translation=None, max_ffmpeg_jobs=None, use_batch_api=None, batch_api_min_entries=None, parakeet_quantize_bits=None):
     """Save configuration to file"""
     global OPENAI_BASE_URL, OPENAI_API_KEY, OPENAI_MODEL, OPENAI_CUSTOM_PROMPT
-    global OPENAI_MAX_CHARS_PER_BATCH, OPENAI_MAX_ENTRIES_PER_BATCH, MAX_PROCESSES
+    global OPENAI_MAX_CHARS_PER_BATCH, OPENAI_MAX_ENTRIES_PER_BATCH, MAX_PROCESSES, MAX_FFMPEG_JOBS
     global MAX_RETRIES, RETRY_BASE_DELAY, RETRY_MAX_DELAY, ENABLE_GOOGLE_FALLBACK
     global SKIP_SUBTITLE_BURNING, SKIP_TRANSLATION
+    global OPENAI_USE_BATCH_API, OPENAI_BATCH_API_MIN_ENTRIES
+    global PARAKEET_QUANTIZE_BITS
 
     # Create config directory if it doesn't exist
     if not os.path.exists(CONFIG_DIR):
@@ -179,18 +205,25 @@ def save_config(base_url, api_key, model=None, custom_prompt=None, max_chars_per
             "max_chars_per_batch": max_chars_per_batch if max_chars_per_batch is not None else DEFAULT_MAX_CHARS_PER_BATCH,
             "max_entries_per_batch": max_entries_per_batch if max_entries_per_batch is not None else DEFAULT_MAX_ENTRIES_PER_BATCH,
             "max_processes": max_processes if max_processes is not None else DEFAULT_MAX_PROCESSES,
+            "max_ffmpeg_jobs": max_ffmpeg_jobs if max_ffmpeg_jobs is not None else MAX_FFMPEG_JOBS,
             # 新增重试配置
             "max_retries": max_retries if max_retries is not None else DEFAULT_MAX_RETRIES,
             "retry_base_delay": retry_base_delay if retry_base_delay is not None else DEFAULT_RETRY_BASE_DELAY,
             "retry_max_delay": retry_max_delay if retry_max_delay is not None else DEFAULT_RETRY_MAX_DELAY,
             "enable_google_fallback": enable_google_fallback if enable_google_fallback is not None else DEFAULT_ENABLE_GOOGLE_FALLBACK,
+            "use_batch_api": use_batch_api if use_batch_api is not None else OPENAI_USE_BATCH_API,
+            "batch_api_min_entries": batch_api_min_entries if batch_api_min_entries is not None else OPENAI_BATCH_API_MIN_ENTRIES,
+            "parakeet_quantize_bits": parakeet_quantize_bits if parakeet_quantize_bits is not None else PARAKEET_QUANTIZE_BITS,
             # 新增视频处理配置
             "skip_subtitle_burning": skip_subtitle_burning if skip_subtitle_burning is not None else DEFAULT_SKIP_SUBTITLE_BURNING,
             "skip_translation": skip_translation if skip_translation is not None else DEFAULT_SKIP_TRANSLATION,
         }
 
-        with open(CONFIG_FILE, "w", encoding="utf-8") as f:
+        # 先写临时文件再原子替换，写入中途崩溃也不会留下损坏的配置文件
+        temp_file = CONFIG_FILE + ".tmp"
+        with open(temp_file, "w", encoding="utf-8") as f:
             json.dump(config, f, ensure_ascii=False, indent=2)
+        os.replace(temp_file, CONFIG_FILE)
 
         # Update global variables
         OPENAI_BASE_URL = base_url
@@ -200,11 +233,15 @@ def save_config(base_url, api_key, model=None, custom_prompt=None, max_chars_per
         OPENAI_MAX_CHARS_PER_BATCH = max_chars_per_batch if max_chars_per_batch is not None else DEFAULT_MAX_CHARS_PER_BATCH
         OPENAI_MAX_ENTRIES_PER_BATCH = max_entries_per_batch if max_entries_per_batch is not None else DEFAULT_MAX_ENTRIES_PER_BATCH
         MAX_PROCESSES = max_processes if max_processes is not None else DEFAULT_MAX_PROCESSES
+        MAX_FFMPEG_JOBS = max_ffmpeg_jobs if max_ffmpeg_jobs is not None else MAX_FFMPEG_JOBS
         # 更新重试配置
         MAX_RETRIES = max_retries if max_retries is not None else DEFAULT_MAX_RETRIES
         RETRY_BASE_DELAY = retry_base_delay if retry_base_delay is not None else DEFAULT_RETRY_BASE_DELAY
         RETRY_MAX_DELAY = retry_max_delay if retry_max_delay is not None else DEFAULT_RETRY_MAX_DELAY
         ENABLE_GOOGLE_FALLBACK = enable_google_fallback if enable_google_fallback is not None else DEFAULT_ENABLE_GOOGLE_FALLBACK
+        OPENAI_USE_BATCH_API = use_batch_api if use_batch_api is not None else OPENAI_USE_BATCH_API
+        OPENAI_BATCH_API_MIN_ENTRIES = batch_api_min_entries if batch_api_min_entries is not None else OPENAI_BATCH_API_MIN_ENTRIES
+        PARAKEET_QUANTIZE_BITS = parakeet_quantize_bits if parakeet_quantize_bits is not None else PARAKEET_QUANTIZE_BITS
         # 更新视频处理配置
         SKIP_SUBTITLE_BURNING = skip_subtitle_burning if skip_subtitle_burning is not None else DEFAULT_SKIP_SUBTITLE_BURNING
         SKIP_TRANSLATION = skip_translation if skip_translation is not None else DEFAULT_SKIP_TRANSLATION
@@ -215,5 +252,26 @@ def save_config(base_url, api_key, model=None, custom_prompt=None, max_chars_per
         return False
 
 
+# 由 load_config/save_config 维护、工作进程需要与主进程保持一致的设置
+RUNTIME_SETTINGS = (
+    "OPENAI_BASE_URL", "OPENAI_API_KEY", "OPENAI_MODEL", "OPENAI_CUSTOM_PROMPT",
+    "OPENAI_MAX_CHARS_PER_BATCH", "OPENAI_MAX_ENTRIES_PER_BATCH", "MAX_PROCESSES", "MAX_FFMPEG_JOBS",
+    "MAX_RETRIES", "RETRY_BASE_DELAY", "RETRY_MAX_DELAY", "ENABLE_GOOGLE_FALLBACK",
+    "SKIP_SUBTITLE_BURNING", "SKIP_TRANSLATION",
+    "OPENAI_USE_BATCH_API", "OPENAI_BATCH_API_MIN_ENTRIES",
+    "PARAKEET_QUANTIZE_BITS",
+)
+
+
+def config_snapshot():
+    """Return the current runtime settings as a picklable dict"""
+    return {name: globals()[name] for name in RUNTIME_SETTINGS}
+
+
+def apply_config_snapshot(snapshot):
+    """Apply settings produced by config_snapshot (used by worker processes)"""
+    globals().update((name, value) for name, value in snapshot.items() if name in RUNTIME_SETTINGS)
+
+
 # Load config on import
 load_config()
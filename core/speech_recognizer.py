@@ -6,13 +6,38 @@ import json
 import threading
 import os
 import math
+import time
 import tempfile
 import subprocess
+import wave
+import importlib.util
 from typing import Any, Dict, Optional, Callable
+
+# 安装了 hf_transfer 时，huggingface_hub 会用多个 HTTP Range 请求并行下载模型权重；
+# 必须在导入 huggingface_hub（parakeet_mlx 会间接导入）之前设置
+if importlib.util.find_spec("hf_transfer") is not None:
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+
+import mlx.core as mx
+import mlx.nn as nn
 from mlx.core import bfloat16, float32
 from parakeet_mlx import AlignedResult, AlignedSentence, AlignedToken, from_pretrained
+try:
+    import numpy as np  # 进程内读取 WAV 采样，省去 parakeet 内部再启动 ffmpeg 解码
+    from parakeet_mlx.audio import get_logmel
+except ImportError:
+    np = None
+    get_logmel = None
 from utils.logger import VideoLogger
 
+try:
+    from config import PARAKEET_QUANTIZE_BITS
+except ImportError:
+    PARAKEET_QUANTIZE_BITS = 0
+
+# 量化分组大小（MLX 支持 32/64/128）
+QUANTIZE_GROUP_SIZE = 64
+
 
 class SpeechRecognizer:
     """语音识别类，封装 Parakeet MLX 模型 - 支持多进程和多线程安全"""
@@ -62,8 +87,18 @@ class SpeechRecognizer:
             progress_callback: 下载进度回调 (percentage, downloaded_mb, total_mb, speed_mbps)
             status_callback: 状态更新回调
         """
-        # 避免重复初始化
+        # 复用已有实例：模型跨视频常驻，只更新本次调用的日志器和回调
         if self._initialized:
+            self.logger = logger
+            self.download_callback = download_callback
+            self.progress_callback = progress_callback
+            self.status_callback = status_callback
+            # 模型配置变化时丢弃已加载的模型，下次转录按新配置重新加载
+            config = (model_name, fp32, local_attention, local_attention_context_size)
+            if config != (self.model_name, self.fp32, self.local_attention, self.local_attention_context_size):
+                with self._model_lock:
+                    self.model_name, self.fp32, self.local_attention, self.local_attention_context_size = config
+                    self._model = None
             return
             
         self.model_name = model_name
@@ -96,7 +131,6 @@ class SpeechRecognizer:
                 
             try:
                 # 使用文件锁防止进程间重复下载（仅在支持的平台上）
-                import tempfile
                 try:
                     import fcntl
                     fcntl_available = True
@@ -142,7 +176,6 @@ class SpeechRecognizer:
                                             raise e
                                         if self.logger:
                                             self.logger.warning(f"Process {self._process_id}: Model loading failed (attempt {attempt + 1}), retrying: {e}")
-                                        import time
                                         time.sleep(2 ** attempt)  # 指数退避
                                 
                                 # 释放锁（函数结束时自动释放）
@@ -176,7 +209,6 @@ class SpeechRecognizer:
                                             raise e
                                         if self.logger:
                                             self.logger.warning(f"Process {self._process_id}: Cached model loading failed (attempt {attempt + 1}), retrying: {e}")
-                                        import time
                                         time.sleep(2 ** attempt)
                                 
                                 # 释放锁
@@ -207,7 +239,6 @@ class SpeechRecognizer:
                                     raise e
                                 if self.logger:
                                     self.logger.warning(f"Process {self._process_id}: Model loading failed (attempt {attempt + 1}), retrying: {e}")
-                                import time
                                 time.sleep(2 ** attempt)
                 else:
                     # fcntl不可用，直接加载模型
@@ -234,7 +265,6 @@ class SpeechRecognizer:
                                 raise e
                             if self.logger:
                                 self.logger.warning(f"Process {self._process_id}: Model loading failed (attempt {attempt + 1}), retrying: {e}")
-                            import time
                             time.sleep(2 ** attempt)
                     
                 # 配置模型参数
@@ -265,6 +295,16 @@ class SpeechRecognizer:
                 except Exception as e:
                     if self.logger:
                         self.logger.warning(f"Process {self._process_id}: Failed to set local attention: {e}")
+                
+                # 可选的权重量化：模型在进程内常驻，只在加载时量化一次，之后所有视频复用
+                if PARAKEET_QUANTIZE_BITS:
+                    try:
+                        nn.quantize(self._model, group_size=QUANTIZE_GROUP_SIZE, bits=PARAKEET_QUANTIZE_BITS)
+                        if self.logger:
+                            self.logger.info(f"Process {self._process_id}: Model weights quantized to {PARAKEET_QUANTIZE_BITS} bits")
+                    except Exception as e:
+                        if self.logger:
+                            self.logger.warning(f"Process {self._process_id}: Failed to quantize model: {e}")
                     
                 if self.logger:
                     self.logger.info(f"Process {self._process_id}: Model loaded successfully")
@@ -281,7 +321,6 @@ class SpeechRecognizer:
     def _check_if_model_needs_download(self):
         """检查模型是否需要下载 - 改进版本，检查关键模型文件"""
         try:
-            import os
             from huggingface_hub import try_to_load_from_cache
             
             # 检查MLX模型的关键文件是否已缓存
@@ -387,6 +426,14 @@ class SpeechRecognizer:
                     # 使用原作者的方式直接调用模型的 transcribe 方法
                     dtype = float32 if self.fp32 else bfloat16
                     
+                    # 不需要分块的 16kHz 单声道 WAV 直接在内存中送入模型，不再经由文件路径重新解码
+                    if not chunk_duration or self._get_audio_duration(audio_path) <= chunk_duration:
+                        result = self._transcribe_in_memory(audio_path, dtype)
+                        if result is not None:
+                            if self.logger:
+                                self.logger.info(f"Process {self._process_id}: In-memory transcription completed successfully")
+                            return result
+                    
                     # 先尝试直接转录，如果因为内存问题失败则降级到分块处理
                     try:
                         result = self._model.transcribe(
@@ -426,8 +473,47 @@ class SpeechRecognizer:
                 self.logger.error(error_msg)
             raise RuntimeError(error_msg)
     
+    def _load_wav_samples(self, audio_path: str, dtype) -> Optional[Any]:
+        """把 16-bit 单声道 PCM WAV 读取为 [-1, 1] 的 mlx 数组；格式不符时返回 None"""
+        sample_rate = self._model.preprocessor_config.sample_rate
+        try:
+            with wave.open(audio_path, 'rb') as wav_file:
+                if (wav_file.getnchannels() != 1 or wav_file.getsampwidth() != 2
+                        or wav_file.getframerate() != sample_rate):
+                    return None
+                frames = wav_file.readframes(wav_file.getnframes())
+        except (wave.Error, EOFError, OSError):
+            return None
+        if not frames:
+            return None
+        samples = np.frombuffer(frames, dtype=np.int16).astype(np.float32) / 32768.0
+        return mx.array(samples).astype(dtype)
+    
+    def _transcribe_in_memory(self, audio_path: str, dtype) -> Optional[AlignedResult]:
+        """在内存中转录整段音频（与 parakeet 单块转录相同的流程），失败时返回 None 交给按路径转录"""
+        if np is None or get_logmel is None:
+            return None
+        try:
+            audio_data = self._load_wav_samples(audio_path, dtype)
+            if audio_data is None:
+                return None
+            mel = get_logmel(audio_data, self._model.preprocessor_config)
+            return self._model.generate(mel)[0]
+        except Exception as e:
+            if self.logger:
+                self.logger.warning(f"Process {self._process_id}: In-memory transcription failed, falling back to file path: {e}")
+            return None
+    
     def _get_audio_duration(self, audio_path: str) -> float:
         """获取音频时长"""
+        # PCM WAV 只需读取文件头即可得到时长，不必启动 ffprobe
+        try:
+            with wave.open(audio_path, 'rb') as wav_file:
+                if wav_file.getframerate() > 0 and wav_file.getnframes() > 0:
+                    return wav_file.getnframes() / wav_file.getframerate()
+        except (wave.Error, EOFError, OSError):
+            pass  # 不是 PCM WAV 或文件头损坏，使用 ffprobe
+        
         try:
             # 使用ffprobe获取音频时长
             cmd = [
@@ -535,20 +621,23 @@ class SpeechRecognizer:
             
             # 使用ffmpeg提取音频块
             cmd = [
-                'ffmpeg', '-y', '-i', audio_path,
+                'ffmpeg', '-y', '-loglevel', 'error', '-i', audio_path,
                 '-ss', str(start_time),
                 '-t', str(end_time - start_time),
                 '-ac', '1', '-ar', '16000',
                 chunk_path
             ]
             
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+            # 只在失败时才解码 stderr
+            result = subprocess.run(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                                    stderr=subprocess.PIPE, timeout=60)
             
             if result.returncode == 0 and os.path.exists(chunk_path) and os.path.getsize(chunk_path) > 0:
                 return chunk_path
             else:
                 if self.logger:
-                    self.logger.warning(f"Process {self._process_id}: Failed to extract audio chunk: {result.stderr}")
+                    stderr = result.stderr[-8192:].decode('utf-8', errors='replace')
+                    self.logger.warning(f"Process {self._process_id}: Failed to extract audio chunk: {stderr}")
                 try:
                     os.unlink(chunk_path)
                 except Exception:
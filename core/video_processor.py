@@ -1,23 +1,87 @@
 import time
+import asyncio
+import concurrent.futures
 import requests
 import requests.adapters
 from PyQt6.QtCore import QRunnable
 import os
 import subprocess
 import sys
-from datetime import datetime
-from deep_translator import GoogleTranslator
+from datetime import datetime, timezone
+import email.utils
+try:
+    import aiohttp  # 可选依赖：并发发送 Google 批次请求
+except ImportError:
+    aiohttp = None
+try:
+    import httpx  # 可选依赖：OpenAI 请求使用 HTTP/2 多路复用
+except ImportError:
+    httpx = None
+try:
+    import av  # 可选依赖：进程内解码音频，省去启动 ffmpeg 子进程
+except ImportError:
+    av = None
+try:
+    import orjson  # 可选依赖：更快地序列化请求体、解析响应
+except ImportError:
+    orjson = None
 from core.worker_signals import WorkerSignals
 from core.speech_recognizer import SpeechRecognizer, SubtitleFormatter
 from utils.logger import VideoLogger
+from utils.translation_cache import TranslationCache
 import threading
 import json
+import collections
+import functools
+import operator
+import hashlib
+import wave
+import logging
+import sqlite3
+import re
 import platform
+import signal
 import multiprocessing as mp
+from multiprocessing import shared_memory
+import pickle
 import queue
 import random
-from typing import Dict, Any, Optional, List
-from config import OPENAI_MODEL, OPENAI_CUSTOM_PROMPT, OPENAI_MAX_CHARS_PER_BATCH, OPENAI_MAX_ENTRIES_PER_BATCH, MAX_PROCESSES
+import struct
+from typing import Dict, Any, Optional, List, Tuple
+from config import OPENAI_MODEL, OPENAI_CUSTOM_PROMPT, OPENAI_MAX_CHARS_PER_BATCH, OPENAI_MAX_ENTRIES_PER_BATCH
+from config import OPENAI_USE_BATCH_API, OPENAI_BATCH_API_MIN_ENTRIES
+from config import MAX_RETRIES, RETRY_BASE_DELAY, RETRY_MAX_DELAY, ENABLE_GOOGLE_FALLBACK
+from config import config_snapshot, apply_config_snapshot
+
+
+# 多进程启动上下文：macOS（.app 打包环境）和 Windows 必须使用 spawn；
+# Linux 上主进程已有 Qt 线程，fork 不安全，改用 forkserver——模块只在 forkserver 中预加载一次，
+# 之后每个工作进程都从它 fork，而不是像 spawn 那样每个任务重新导入全部依赖。
+# 预加载时读取的是当时的 config.json，之后保存的设置由管理器随每个任务传给工作进程（apply_worker_config）
+if sys.platform.startswith('linux'):
+    MP_CONTEXT = mp.get_context('forkserver')
+    MP_CONTEXT.set_forkserver_preload(['core.video_processor'])
+else:
+    MP_CONTEXT = mp.get_context('spawn')
+
+# 多进程管理器的调试日志：UI 每 100ms 轮询管理器，逐任务的调度信息不再直接 print，
+# 默认只输出 WARNING 及以上，需要排查调度问题时调低级别即可
+mp_logger = logging.getLogger('videoCaptioner.mp')
+mp_logger.setLevel(logging.WARNING)
+
+# SRT 条目：序号行、时间轴行，以及其后连续的非空文本行（遇到空行或文件结束为止）
+SRT_ENTRY_PATTERN = re.compile(r'^[ \t]*(\d+)[ \t]*\n[ \t]*([^\n]*-->[^\n]*)((?:\n[ \t]*\S[^\n]*)*)', re.MULTILINE)
+
+# Google 批量翻译的编号哨兵：每行以 "@@i@@" 开头，按编号解析译文
+GOOGLE_SENTINEL_PATTERN = re.compile(r'@@\s*(\d+)\s*@@\s*(.*?)(?=@@\s*\d+\s*@@|\Z)', re.DOTALL)
+GOOGLE_SENTINEL_LENGTH = len("\n@@0000@@ ")
+
+# 烧录失败时错误信息中保留的 ffmpeg stderr 行数
+FFMPEG_STDERR_TAIL_LINES = 64
+
+# ffmpeg 滤镜参数的两级转义：滤镜选项值中的特殊字符，以及滤镜图中的特殊字符
+FFMPEG_OPTION_ESCAPE_PATTERN = re.compile(r"[\\':]")
+FFMPEG_GRAPH_ESCAPE_PATTERN = re.compile(r"[\\'\[\],;]")
 
 
 class ContentFilteredException(Exception):
@@ -27,11 +91,65 @@ class ContentFilteredException(Exception):
 
 class RetryableAPIException(Exception):
     """Exception for API errors that can be retried"""
-    pass
+    
+    def __init__(self, message, retry_after=None):
+        super().__init__(message)
+        self.retry_after = retry_after  # 服务端 Retry-After 建议的等待秒数
+
+
+# OpenAI 可重试的HTTP状态码：请求超时、限流和服务端临时错误
+RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+
+def parse_retry_after(value) -> Optional[float]:
+    """解析 Retry-After 响应头（秒数或 HTTP 日期），缺失或无法解析时返回 None"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (email.utils.parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD 自适应并发上限（在单个事件循环中使用）
+    请求顺利时每完成一轮上限加一；请求失败或耗时明显高于平滑平均值（通常是 429 后的退避重试）时上限减半
+    """
+    
+    def __init__(self, initial: int, maximum: int, slowdown_factor: float = 2.0):
+        self.limit = float(initial)
+        self.maximum = maximum
+        self.slowdown_factor = slowdown_factor
+        self.latency_ewma = None  # 成功请求耗时的指数加权平均（秒）
+        self._in_flight = 0
+        self._condition = asyncio.Condition()
+    
+    async def acquire(self):
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < int(self.limit))
+            self._in_flight += 1
+    
+    async def release(self, latency: float, success: bool = True):
+        async with self._condition:
+            self._in_flight -= 1
+            congested = not success or (
+                self.latency_ewma is not None and latency > self.latency_ewma * self.slowdown_factor)
+            if congested:
+                self.limit = max(1.0, self.limit / 2)
+            else:
+                self.limit = min(float(self.maximum), self.limit + 1 / self.limit)
+            if success:
+                self.latency_ewma = latency if self.latency_ewma is None else 0.8 * self.latency_ewma + 0.2 * latency
+            self._condition.notify_all()
 
 
 def exponential_backoff_retry(func, max_retries=None, base_delay=None, max_delay=None, 
-                             retryable_status_codes={429, 500, 502, 503, 504}):
+                             retryable_status_codes=RETRYABLE_STATUS_CODES):
     """
     通用的指数退避重试装饰器函数
     
@@ -44,16 +162,9 @@ def exponential_backoff_retry(func, max_retries=None, base_delay=None, max_delay
     """
     def wrapper(*args, **kwargs):
         # 从配置文件获取重试参数
-        try:
-            from config import MAX_RETRIES, RETRY_BASE_DELAY, RETRY_MAX_DELAY
-            actual_max_retries = max_retries if max_retries is not None else MAX_RETRIES
-            actual_base_delay = base_delay if base_delay is not None else RETRY_BASE_DELAY
-            actual_max_delay = max_delay if max_delay is not None else RETRY_MAX_DELAY
-        except ImportError:
-            # 如果无法导入配置，使用默认值
-            actual_max_retries = max_retries if max_retries is not None else 3
-            actual_base_delay = base_delay if base_delay is not None else 1.0
-            actual_max_delay = max_delay if max_delay is not None else 60.0
+        actual_max_retries = max_retries if max_retries is not None else MAX_RETRIES
+        actual_base_delay = base_delay if base_delay is not None else RETRY_BASE_DELAY
+        actual_max_delay = max_delay if max_delay is not None else RETRY_MAX_DELAY
         
         last_exception = None
         
@@ -76,6 +187,8 @@ def exponential_backoff_retry(func, max_retries=None, base_delay=None, max_delay
                                   requests.exceptions.ConnectionError,
                                   requests.exceptions.RequestException)):
                     should_retry = True
+                elif httpx is not None and isinstance(e, httpx.TransportError):
+                    should_retry = True
                 elif "rate limit" in str(e).lower() or "too many requests" in str(e).lower():
                     should_retry = True
                 elif isinstance(e, RetryableAPIException):
@@ -89,8 +202,11 @@ def exponential_backoff_retry(func, max_retries=None, base_delay=None, max_delay
                     # 对于其他不可重试的错误，直接抛出
                     break
                 
-                # 计算延迟时间（指数退避 + 随机抖动）
+                # 计算延迟时间（指数退避 + 随机抖动）；服务端给出 Retry-After 时按其等待
                 delay = min(actual_base_delay * (2 ** attempt), actual_max_delay)
+                retry_after = getattr(e, 'retry_after', None)
+                if retry_after is not None:
+                    delay = min(retry_after, actual_max_delay)
                 jitter = random.uniform(0.1, 0.3) * delay  # 添加10-30%的随机抖动
                 total_delay = delay + jitter
                 
@@ -104,6 +220,685 @@ def exponential_backoff_retry(func, max_retries=None, base_delay=None, max_delay
     return wrapper
 
 
+def create_openai_session(api_key, pool_connections=10, pool_maxsize=20):
+    """创建 OpenAI 请求会话：安装了 httpx[http2] 时使用单个 TLS 连接上的 HTTP/2 多路复用，否则使用 requests 连接池"""
+    # Content-Type 由 json= / files= 按请求自动设置（Batch API 上传文件需要 multipart）
+    headers = {
+        "Authorization": f"Bearer {api_key}"
+    }
+    
+    if httpx is not None:
+        try:
+            transport = httpx.HTTPTransport(
+                http2=True,
+                retries=3,
+                limits=httpx.Limits(max_connections=pool_maxsize, max_keepalive_connections=pool_connections)
+            )
+            return httpx.Client(headers=headers, timeout=300, transport=transport)
+        except ImportError:
+            # 未安装 h2 时 httpx 无法启用 HTTP/2，回退到 requests
+            pass
+    
+    session = requests.Session()
+    session.headers.update(headers)
+    
+    # 配置连接池以提高性能
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=3,
+        pool_block=False
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def post_json(session, url, payload, timeout):
+    """发送 JSON 请求：安装了 orjson 时预先序列化为 bytes，兼容 httpx.Client 和 requests.Session"""
+    if orjson is None:
+        return session.post(url, json=payload, timeout=timeout)
+    body = orjson.dumps(payload)
+    headers = {"Content-Type": "application/json"}
+    if httpx is not None and isinstance(session, httpx.Client):
+        return session.post(url, content=body, headers=headers, timeout=timeout)
+    return session.post(url, data=body, headers=headers, timeout=timeout)
+
+
+def parse_json_response(response):
+    """解析 JSON 响应体，只解析一次；安装了 orjson 时直接解析原始字节"""
+    if orjson is None:
+        return response.json()
+    return orjson.loads(response.content)
+
+
+def loads_json(data):
+    """解析 JSON 文本或字节：安装了 orjson 时使用 orjson（解析错误同样是 ValueError 的子类）"""
+    if orjson is None:
+        return json.loads(data)
+    return orjson.loads(data)
+
+
+# 进程内按 API Key 共享的 OpenAI 会话，连接在所有视频之间复用（httpx.Client / requests.Session 均可跨线程使用）
+_shared_openai_sessions = {}
+_shared_openai_sessions_lock = threading.Lock()
+
+
+def get_shared_openai_session(api_key, warm_url=None):
+    """获取当前进程共享的 OpenAI 会话，首次调用时创建（并按 warm_url 预热）；处理多个视频时不再重复 TCP/TLS 握手"""
+    with _shared_openai_sessions_lock:
+        session = _shared_openai_sessions.get(api_key)
+        if session is None:
+            session = _shared_openai_sessions[api_key] = create_openai_session(
+                api_key, pool_connections=64, pool_maxsize=128)
+            if warm_url:
+                warm_openai_session(session, warm_url)
+        return session
+
+
+def warm_openai_session(session, base_url):
+    """在后台线程预先建立连接（DNS、TCP、TLS、HTTP/2 握手），与音频提取和语音识别重叠，首个翻译请求不再承担握手延迟"""
+    def _warm():
+        try:
+            session.head(base_url, timeout=10)
+        except Exception:
+            pass  # 预热失败不影响后续请求
+    
+    threading.Thread(target=_warm, daemon=True).start()
+
+
+# 每个线程复用一个 GoogleTranslator，避免每个批次重复构造
+_google_translator_local = threading.local()
+
+
+def get_google_translator():
+    """获取当前线程的 GoogleTranslator 实例（auto -> zh-CN），首次调用时创建"""
+    translator = getattr(_google_translator_local, 'translator', None)
+    if translator is None:
+        # 延迟导入：只用 OpenAI 或在 aiohttp 并发路径全部成功时不需要加载 deep_translator
+        from deep_translator import GoogleTranslator
+        translator = _google_translator_local.translator = GoogleTranslator(source='auto', target='zh-CN')
+    return translator
+
+
+# Google 免费翻译接口（aiohttp 并发路径使用）
+GOOGLE_TRANSLATE_URL = "https://translate.googleapis.com/translate_a/single"
+GOOGLE_ASYNC_CONCURRENCY = 16  # 同时在途的 Google 请求数
+OPENAI_BATCH_CONCURRENCY = 4  # 同时在途的 OpenAI 批次请求数（初始值，随后按响应耗时自适应调整）
+OPENAI_MAX_BATCH_CONCURRENCY = 16  # 自适应调整的上限
+OPENAI_MAX_RESPONSE_TOKENS = 8000  # 单个请求的响应 token 上限
+OPENAI_FALLBACK_BATCH_SIZE = 16  # JSON 批次条数不一致时，拆成不超过该条数的小批次重试
+OPENAI_BATCH_API_POLL_MIN_DELAY = 5  # Batch API 状态轮询的初始间隔（秒）
+OPENAI_BATCH_API_POLL_MAX_DELAY = 300  # Batch API 状态轮询的最大间隔（秒）
+OPENAI_BATCH_API_MAX_WAIT = 2 * 3600  # 最多等待 Batch API 的时间（秒），超时后取消远端批处理并改用常规请求
+
+# 按 API 地址记住自适应并发的收敛结果，下一个视频从上次的上限和平均耗时开始，不再从初始值重新探测；
+# 多进程时由管理器在工作进程之间传递（export/import_openai_concurrency_state）
+_openai_concurrency_state = {}
+_openai_concurrency_state_lock = threading.Lock()
+
+
+def create_openai_limiter(base_url):
+    """为一轮并发批次创建自适应并发限制器，沿用该 API 地址上次学到的上限和平均耗时"""
+    with _openai_concurrency_state_lock:
+        state = _openai_concurrency_state.get(base_url)
+    if state is None:
+        return AdaptiveConcurrencyLimiter(OPENAI_BATCH_CONCURRENCY, OPENAI_MAX_BATCH_CONCURRENCY)
+    limit, latency_ewma = state
+    limiter = AdaptiveConcurrencyLimiter(limit, OPENAI_MAX_BATCH_CONCURRENCY)
+    limiter.latency_ewma = latency_ewma
+    return limiter
+
+
+def remember_openai_limiter(base_url, limiter):
+    """保存限制器的当前上限和平均耗时，供后续视频复用"""
+    with _openai_concurrency_state_lock:
+        _openai_concurrency_state[base_url] = (limiter.limit, limiter.latency_ewma)
+
+
+def export_openai_concurrency_state():
+    """返回本进程学到的 {API 地址: (上限, 平均耗时)}，随工作进程的结果交给管理器"""
+    with _openai_concurrency_state_lock:
+        return dict(_openai_concurrency_state)
+
+
+def import_openai_concurrency_state(state):
+    """合并管理器汇总的状态（可能来自其他工作进程，比本进程的记录更新）"""
+    with _openai_concurrency_state_lock:
+        _openai_concurrency_state.update(state)
+
+
+def build_google_batch_text(entries):
+    """把一个批次的字幕拼成带编号哨兵的文本，返回 (去重后的原文列表, 拼接文本)"""
+    # 提取需要翻译的文本并去重（保持顺序），重复行只翻译一次
+    unique_texts = list({entry['text']: None for entry in entries})
+    # 每行前加编号哨兵 @@i@@，Google 不会翻译编号，即使改动了换行也能按编号对齐
+    combined_text = "\n".join(f"@@{i}@@ {text}" for i, text in enumerate(unique_texts))
+    return unique_texts, combined_text
+
+
+def extract_audio_with_pyav(video_path, audio_path):
+    """用 PyAV 在进程内解码第一条音轨，重采样为 16kHz 单声道 16-bit WAV"""
+    with av.open(video_path) as container:
+        stream = container.streams.audio[0]
+        resampler = av.AudioResampler(format='s16', layout='mono', rate=16000)
+        with wave.open(audio_path, 'wb') as wav_file:
+            wav_file.setnchannels(1)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(16000)
+            
+            def _write(frames):
+                for frame in frames:
+                    # 平面缓冲区可能带有对齐填充，只写入有效采样
+                    wav_file.writeframes(bytes(frame.planes[0])[:frame.samples * 2])
+            
+            for frame in container.decode(stream):
+                _write(resampler.resample(frame))
+            _write(resampler.resample(None))  # 刷出重采样器中剩余的采样
+            return wav_file.getnframes()
+
+
+def run_ffmpeg_quiet(cmd, timeout):
+    """运行只关心成败的 ffmpeg 命令：stdin/stdout 接到 DEVNULL，stderr 以字节收集，只在失败时解码末尾部分"""
+    result = subprocess.run(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                            stderr=subprocess.PIPE, timeout=timeout)
+    if result.returncode != 0:
+        stderr = result.stderr[-8192:].decode('utf-8', errors='replace')
+        raise subprocess.CalledProcessError(result.returncode, cmd, stderr=stderr)
+
+
+def find_ffprobe_path(ffmpeg_path) -> Optional[str]:
+    """ffmpeg 同目录下的 ffprobe 路径，不存在时返回 None"""
+    ffprobe_path = os.path.join(os.path.dirname(ffmpeg_path), 'ffprobe') if ffmpeg_path else None
+    return ffprobe_path if ffprobe_path and os.path.exists(ffprobe_path) else None
+
+
+def probe_has_audio(ffmpeg_path, video_path) -> Optional[bool]:
+    """只读取容器元数据判断是否有音频流：优先 ffprobe，其次 PyAV，都不可用时返回 None"""
+    ffprobe_path = find_ffprobe_path(ffmpeg_path)
+    if ffprobe_path:
+        try:
+            result = subprocess.run(
+                [ffprobe_path, '-v', 'error', '-select_streams', 'a:0',
+                 '-show_entries', 'stream=codec_type', '-of', 'csv=p=0', video_path],
+                capture_output=True, text=True, timeout=5
+            )
+            if result.returncode == 0:
+                return result.stdout.strip().startswith('audio')
+        except (subprocess.SubprocessError, OSError):
+            pass
+    if av is not None:
+        try:
+            with av.open(video_path) as container:
+                return bool(container.streams.audio)
+        except Exception:
+            pass
+    return None
+
+
+def probe_media_duration(ffmpeg_path, video_path) -> Optional[float]:
+    """获取媒体时长（秒）：优先使用 ffmpeg 同目录的 ffprobe，其次 PyAV，都不可用时返回 None"""
+    ffprobe_path = find_ffprobe_path(ffmpeg_path)
+    if ffprobe_path:
+        try:
+            result = subprocess.run(
+                [ffprobe_path, '-v', 'error', '-show_entries', 'format=duration',
+                 '-of', 'default=noprint_wrappers=1:nokey=1', video_path],
+                capture_output=True, text=True, timeout=30
+            )
+            if result.returncode == 0:
+                return float(result.stdout.strip())
+        except (subprocess.SubprocessError, ValueError, OSError):
+            pass
+    if av is not None:
+        try:
+            with av.open(video_path) as container:
+                if container.duration:
+                    return container.duration / av.time_base
+        except Exception:
+            pass
+    return None
+
+
+def temp_output_path(output_path):
+    """烧录时 ffmpeg 先写入的临时文件路径（同目录，保留扩展名以便 ffmpeg 推断容器格式）"""
+    base, ext = os.path.splitext(output_path)
+    return f"{base}.tmp{ext}"
+
+
+def finalize_output_file(temp_path, output_path):
+    """校验临时输出文件，原子替换到最终路径，并让内核释放它占用的页缓存"""
+    if not os.path.exists(temp_path) or os.path.getsize(temp_path) == 0:
+        raise RuntimeError("Video processing failed: output file is empty or missing")
+    # 中途失败或被终止时不会留下半截的输出视频
+    os.replace(temp_path, output_path)
+    # 刚写完的视频短期内不会再读，不让它挤占模型权重等热数据的页缓存（macOS 没有 posix_fadvise）
+    if hasattr(os, 'posix_fadvise'):
+        fd = os.open(output_path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+def discard_temp_output(temp_path):
+    """删除失败或被终止的烧录留下的临时文件"""
+    try:
+        os.remove(temp_path)
+    except FileNotFoundError:
+        pass
+
+
+def parse_ffmpeg_progress_line(line, duration) -> Optional[float]:
+    """
+    解析 ffmpeg -progress 输出的一行 key=value，返回已编码时长占总时长的比例 (0~1)，不含进度时返回 None
+    out_time_us / out_time_ms 的单位都是微秒（ffmpeg 的历史命名）
+    """
+    key, _, value = line.strip().partition('=')
+    if key in ('out_time_us', 'out_time_ms') and duration:
+        try:
+            return min(1.0, int(value) / 1_000_000 / duration)
+        except ValueError:
+            return None  # 起始阶段可能输出 N/A
+    if key == 'progress' and value == 'end':
+        return 1.0
+    return None
+
+
+async def run_ffmpeg_with_progress(cmd, duration, callback, on_start=None):
+    """
+    异步运行 ffmpeg：读取 stdout 上的 -progress 流回调进度比例，同时读完 stderr
+    返回 (退出码, stderr 最后 FFMPEG_STDERR_TAIL_LINES 行)；on_start 在进程启动后收到进程对象（用于终止）
+    """
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    if on_start:
+        on_start(process)
+    
+    async def _read_progress():
+        async for raw in process.stdout:
+            fraction = parse_ffmpeg_progress_line(raw.decode('utf-8', errors='replace'), duration)
+            if fraction is not None:
+                callback(fraction)
+    
+    # 只保留最后几行 stderr 用于错误信息，长时间编码时内存占用不随输出增长
+    stderr_tail = collections.deque(maxlen=FFMPEG_STDERR_TAIL_LINES)
+    
+    async def _read_stderr():
+        async for raw in process.stderr:
+            stderr_tail.append(raw.decode('utf-8', errors='replace'))
+    
+    try:
+        # stdout 和 stderr 在同一个事件循环中并发读取，任何一个管道写满都不会阻塞 ffmpeg
+        await asyncio.gather(_read_progress(), _read_stderr())
+        return await process.wait(), "".join(stderr_tail)
+    finally:
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+
+
+def coalesce_progress_updates(updates):
+    """每个视频的每种更新（进度/状态）只保留最新一条，界面每次轮询对每个视频最多刷新一次"""
+    latest = {}
+    for update in updates:
+        latest[(update['type'], update['video_path'])] = update
+    return list(latest.values())
+
+
+def parse_srt_entries(content):
+    """用一次正则扫描解析 SRT 内容，返回 [{'id', 'timestamp', 'text'}]，跳过没有文本的条目"""
+    entries = []
+    for match in SRT_ENTRY_PATTERN.finditer(content.replace('\r\n', '\n')):
+        text = '\n'.join(line.strip() for line in match.group(3).split('\n') if line.strip())
+        if text:
+            entries.append({
+                'id': int(match.group(1)),
+                'timestamp': match.group(2).strip(),
+                'text': text
+            })
+    return entries
+
+
+def build_bilingual_entries(entries, tx_map):
+    """按 原文 -> 译文 映射构建双语字幕条目，译文为空时使用原文"""
+    # 列表推导一次性构建，用 str.join 拼接双语文本
+    return [
+        {
+            'id': entry['id'],
+            'timestamp': entry['timestamp'],
+            'text': "\n".join((entry['text'], tx_map.get(entry['text']) or entry['text']))
+        }
+        for entry in entries
+    ]
+
+
+def pair_bilingual_entries(entries, translations):
+    """按位置把译文与原条目配对，构建双语字幕条目；译文缺失或为空时使用原文"""
+    return [
+        {
+            'id': entry['id'],
+            'timestamp': entry['timestamp'],
+            'text': "\n".join((entry['text'], (translations[i].strip() if i < len(translations) else "") or entry['text']))
+        }
+        for i, entry in enumerate(entries)
+    ]
+
+
+# 持久化翻译缓存文件名（位于 cache_dir 下，所有视频和进程共享）
+TRANSLATION_CACHE_FILENAME = "translation_cache.sqlite3"
+# 翻译失败时条目中带有的占位后缀，这类结果不写入缓存
+TRANSLATION_FAILURE_SUFFIX = "- showing original]"
+
+
+def build_openai_json_prompt(texts):
+    """构建多条字幕的 JSON 批量翻译请求：输入 {"lines": [...]}，要求返回等长的 {"translations": [...]}"""
+    # 紧凑序列化、保留非 ASCII 字符原样，尽量减少发送的输入 token
+    if orjson is None:
+        payload = json.dumps({"lines": texts}, ensure_ascii=False, separators=(',', ':'))
+    else:
+        payload = orjson.dumps({"lines": texts}).decode('utf-8')
+    return (
+        f"Translate each item of \"lines\" to Chinese. Return a JSON object "
+        f"{{\"translations\": [...]}} with exactly {len(texts)} strings in the same order. "
+        f"Use this JSON format even if other instructions ask for a different output format:\n\n{payload}"
+    )
+
+
+def split_fallback_batches(entries):
+    """把译文条数不一致的批次拆成更小的批次重试：每次至少减半，最终退化为单条请求，保证递归终止"""
+    size = max(1, min(OPENAI_FALLBACK_BATCH_SIZE, len(entries) // 2))
+    return [entries[i:i + size] for i in range(0, len(entries), size)]
+
+
+def estimate_openai_max_tokens(texts):
+    """按输入长度估算响应所需的 token 上限：中文译文的 token 数通常不超过原文字符数，另加 JSON 包装的余量"""
+    total_chars = sum(len(text) for text in texts)
+    return min(OPENAI_MAX_RESPONSE_TOKENS, 256 + total_chars + 16 * len(texts))
+
+
+def build_openai_chat_payload(model, texts):
+    """构建翻译请求体：单段落直接翻译，多段落使用 JSON 数组（常规请求和 Batch API 共用）"""
+    if len(texts) == 1:
+        user_prompt = f"Translate to Chinese (output translation only):\n\n{texts[0]}"
+    else:
+        user_prompt = build_openai_json_prompt(texts)
+    
+    # 使用配置文件中的自定义prompt
+    data = {
+        "model": model,
+        "messages": [
+            {"role": "system", "content": OPENAI_CUSTOM_PROMPT},
+            {"role": "user", "content": user_prompt}
+        ],
+        "temperature": 0,
+        # 按批次大小预留响应 token，短批次不会按上限计入速率限制的 token 配额
+        "max_tokens": estimate_openai_max_tokens(texts)
+    }
+    if len(texts) > 1:
+        data["response_format"] = {"type": "json_object"}
+    return data
+
+
+def parse_openai_json_translations(content, expected_count):
+    """解析 JSON 批量翻译结果，格式不对或条数不一致时返回 None"""
+    try:
+        translations = loads_json(content).get('translations')
+    except (ValueError, AttributeError):
+        return None
+    if not isinstance(translations, list) or len(translations) != expected_count:
+        return None
+    return [text if isinstance(text, str) else "" for text in translations]
+
+
+def translation_cache_namespace(engine, api_settings):
+    """翻译缓存的命名空间：区分引擎、模型和提示词，修改提示词后旧译文不再命中"""
+    if engine == "OpenAI Translate":
+        prompt_hash = hashlib.sha256(OPENAI_CUSTOM_PROMPT.encode('utf-8')).hexdigest()[:16]
+        return f"openai|{api_settings.get('model', OPENAI_MODEL)}|{prompt_hash}"
+    return "google|zh-CN"
+
+
+def run_openai_batch_api(session, base_url, payloads, status_callback=None):
+    """
+    通过 OpenAI Batch API 一次提交多个 chat completion 请求，轮询直到批处理结束
+    返回 {请求序号: 响应 body}，只包含成功的请求；费用约为常规请求的一半，但最长可能需要 24 小时
+    """
+    jsonl = "\n".join(
+        json.dumps({"custom_id": str(i), "method": "POST", "url": "/v1/chat/completions", "body": payload},
+                   ensure_ascii=False)
+        for i, payload in enumerate(payloads)
+    )
+    response = session.post(
+        f"{base_url}/v1/files",
+        files={"file": ("subtitles.jsonl", jsonl.encode('utf-8'), "application/jsonl")},
+        data={"purpose": "batch"},
+        timeout=300
+    )
+    response.raise_for_status()
+    response = session.post(
+        f"{base_url}/v1/batches",
+        json={"input_file_id": response.json()['id'], "endpoint": "/v1/chat/completions", "completion_window": "24h"},
+        timeout=60
+    )
+    response.raise_for_status()
+    batch = response.json()
+    
+    # 按指数退避轮询批处理状态；超时、出错或进程被停止时取消远端批处理，不让它在后台继续运行计费
+    deadline = time.monotonic() + OPENAI_BATCH_API_MAX_WAIT
+    delay = OPENAI_BATCH_API_POLL_MIN_DELAY
+    try:
+        while batch['status'] not in ('completed', 'failed', 'expired', 'cancelled'):
+            if status_callback:
+                status_callback(batch)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"OpenAI batch {batch['id']} did not finish within {OPENAI_BATCH_API_MAX_WAIT}s")
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, OPENAI_BATCH_API_POLL_MAX_DELAY)
+            response = session.get(f"{base_url}/v1/batches/{batch['id']}", timeout=60)
+            response.raise_for_status()
+            batch = response.json()
+    except BaseException:
+        cancel_openai_batch(session, base_url, batch['id'])
+        raise
+    
+    # 过期的批处理也可能带有部分结果
+    if not batch.get('output_file_id'):
+        raise RuntimeError(f"OpenAI batch {batch['id']} ended with status '{batch['status']}' and no output")
+    response = session.get(f"{base_url}/v1/files/{batch['output_file_id']}/content", timeout=300)
+    response.raise_for_status()
+    
+    bodies = {}
+    for line in response.content.splitlines():
+        if not line.strip():
+            continue
+        item = loads_json(line)
+        result = item.get('response') or {}
+        if result.get('status_code') == 200:
+            bodies[int(item['custom_id'])] = result['body']
+    return bodies
+
+
+def cancel_openai_batch(session, base_url, batch_id):
+    """尽力取消远端的 Batch API 批处理，失败只记录日志"""
+    try:
+        # 超时要短：进程被停止时管理器只等待几秒
+        session.post(f"{base_url}/v1/batches/{batch_id}/cancel", timeout=3).raise_for_status()
+    except Exception as e:
+        mp_logger.warning("Failed to cancel OpenAI batch %s: %s", batch_id, e)
+
+
+def extract_openai_translations(result, expected_count):
+    """从 chat completion 响应中取出译文列表，结构不对、被过滤或条数不一致时返回 None"""
+    try:
+        choice = result['choices'][0]
+        if choice.get('finish_reason') == 'content_filter':
+            return None
+        content = choice['message']['content'].strip()
+    except (KeyError, IndexError, TypeError, AttributeError):
+        return None
+    if expected_count == 1:
+        return [content]
+    return parse_openai_json_translations(content, expected_count)
+
+
+def normalize_translation_text(text: str) -> str:
+    """归一化待翻译文本（合并空白），用作去重和缓存的键；不改变大小写，以免合并含义不同的行"""
+    return " ".join(text.split())
+
+
+def translate_with_cache(cache_dir, namespace, entries, translate_func):
+    """先查持久化翻译缓存，把未命中的条目按归一化文本去重后交给 translate_func，并把新译文写回缓存"""
+    try:
+        cache = TranslationCache(os.path.join(cache_dir, TRANSLATION_CACHE_FILENAME))
+    except sqlite3.Error:
+        # 缓存不可用时不影响翻译
+        return translate_func(entries)
+    
+    normalized = {entry['text']: normalize_translation_text(entry['text']) for entry in entries}
+    with cache:
+        keys = {norm: TranslationCache.make_key(namespace, norm) for norm in normalized.values()}
+        try:
+            cached = cache.get_many(set(keys.values()))
+        except sqlite3.Error as e:
+            # 缓存被锁或损坏时全部按未命中处理，翻译照常进行
+            mp_logger.warning("Translation cache read failed, translating without cache: %s", e)
+            cached = {}
+        tx_map = {norm: cached[key] for norm, key in keys.items() if key in cached}
+        
+        # 归一化后相同的文本只翻译一次：取首次出现的条目作为代表，结果再分发给所有重复条目
+        representatives = {}
+        for entry in entries:
+            norm = normalized[entry['text']]
+            if norm not in tx_map:
+                representatives.setdefault(norm, entry)
+        translated = translate_func(list(representatives.values())) if representatives else []
+        
+        rep_norms = {entry['id']: norm for norm, entry in representatives.items()}
+        results_by_norm = {}
+        new_items = {}
+        for entry in translated:
+            norm = rep_norms.get(entry['id'])
+            if norm is None:
+                continue
+            results_by_norm[norm] = entry['text']
+            # 从双语文本 "原文\n译文" 中取出新译文写回缓存；译文为空、与原文相同或是失败占位时不缓存
+            original = representatives[norm]['text']
+            if not entry['text'].startswith(original + "\n"):
+                continue
+            translation = entry['text'][len(original) + 1:]
+            if translation and translation != original and not translation.endswith(TRANSLATION_FAILURE_SUFFIX):
+                tx_map[norm] = translation
+                new_items[keys[norm]] = translation
+        try:
+            cache.put_many(new_items)
+        except sqlite3.Error as e:
+            # 写缓存失败（如数据库被锁、磁盘已满）只影响下次命中，不让本次翻译失败
+            mp_logger.warning("Translation cache write failed, skipping %d entries: %s", len(new_items), e)
+    
+    # 有译文的条目用各自的原文拼成双语文本；没有可用译文时沿用代表条目的输出（如失败占位），
+    # 按输入顺序输出，调用方拿到的就是按编号排好序的列表
+    def _output(entry):
+        norm = normalized[entry['text']]
+        translation = tx_map.get(norm)
+        if translation is not None:
+            return "\n".join((entry['text'], translation or entry['text']))
+        if representatives.get(norm, entry)['text'] == entry['text']:
+            return results_by_norm.get(norm, entry['text'])
+        return entry['text']
+    
+    return [
+        {
+            'id': entry['id'],
+            'timestamp': entry['timestamp'],
+            'text': _output(entry)
+        }
+        for entry in entries
+    ]
+
+
+async def _google_translate_text_async(session, semaphore, text):
+    """通过 aiohttp 翻译一段文本（auto -> zh-CN），对 429/5xx 做指数退避重试"""
+    params = {'client': 'gtx', 'sl': 'auto', 'tl': 'zh-CN', 'dt': 't', 'q': text}
+    for attempt in range(MAX_RETRIES + 1):
+        async with semaphore:
+            async with session.get(GOOGLE_TRANSLATE_URL, params=params) as response:
+                if response.status not in (429, 500, 502, 503, 504) or attempt == MAX_RETRIES:
+                    response.raise_for_status()
+                    data = await response.json(content_type=None)
+                    # 返回格式: [[[译文片段, 原文片段, ...], ...], ...]
+                    return "".join(segment[0] for segment in data[0] if segment and segment[0])
+        delay = min(RETRY_BASE_DELAY * (2 ** attempt), RETRY_MAX_DELAY)
+        await asyncio.sleep(delay + random.uniform(0.1, 0.3) * delay)
+
+
+async def translate_google_texts_async(texts):
+    """并发翻译多段文本，返回与输入顺序一致的列表；失败的条目为异常对象"""
+    semaphore = asyncio.Semaphore(GOOGLE_ASYNC_CONCURRENCY)
+    timeout = aiohttp.ClientTimeout(total=60)
+    async with aiohttp.ClientSession(timeout=timeout) as session:
+        return await asyncio.gather(
+            *(_google_translate_text_async(session, semaphore, text) for text in texts),
+            return_exceptions=True
+        )
+
+
+def translate_google_texts_individually(texts):
+    """
+    逐条翻译多段文本（批量翻译失败时的尽力回退），返回 ({原文: 译文}, 失败条数)
+    安装了 aiohttp 时所有条目并发请求，并发失败的条目再用同步翻译器重试一次
+    """
+    tx_map = {}
+    pending = list(texts)
+    if aiohttp is not None and len(pending) > 1:
+        responses = asyncio.run(translate_google_texts_async(pending))
+        tx_map = {text: response for text, response in zip(pending, responses)
+                  if response and not isinstance(response, Exception)}
+        pending = [text for text in pending if text not in tx_map]
+    
+    failed_count = 0
+    if pending:
+        translator = get_google_translator()
+        for text in pending:
+            try:
+                tx_map[text] = translator.translate(text)
+            except Exception:
+                failed_count += 1
+    return tx_map, failed_count
+
+
+# 系统探测结果在进程内只计算一次，批量处理时不再为每个视频重复启动 sysctl / ffmpeg -version
+@functools.lru_cache(maxsize=1)
+def detect_apple_silicon() -> bool:
+    """检测是否是Apple Silicon"""
+    if platform.system() != 'Darwin':
+        return False
+    try:
+        result = subprocess.run(['sysctl', '-n', 'hw.optional.arm64'], 
+                              capture_output=True, text=True, timeout=5)
+        return result.returncode == 0 and result.stdout.strip() == '1'
+    except Exception:
+        return False
+
+
+@functools.lru_cache(maxsize=4)
+def detect_videotoolbox(ffmpeg_path: str) -> bool:
+    """检查 ffmpeg 是否支持 VideoToolbox 硬件加速"""
+    try:
+        result = subprocess.run([ffmpeg_path, '-version'], 
+                              capture_output=True, text=True, timeout=5)
+        return result.returncode == 0 and 'videotoolbox' in result.stdout.lower()
+    except Exception:
+        return False
+
+
 class VideoProcessor(QRunnable):
     def __init__(self, video_path, engine, api_settings, cache_dir,
                  progress_callback=None, status_callback=None):
@@ -117,23 +912,12 @@ class VideoProcessor(QRunnable):
         self.base_name = os.path.basename(video_path)
         self.logger = VideoLogger(cache_dir)
         self.signals = WorkerSignals()
+        self._last_progress = None  # 上次发出的进度，相同的进度不重复发送信号
         
-        # 创建复用的requests会话以提高性能
-        self.session = requests.Session()
-        self.session.headers.update({
-            "Authorization": f"Bearer {self.api_settings.get('api_key', '')}",
-            "Content-Type": "application/json"
-        })
-        
-        # 配置连接池以提高性能
-        adapter = requests.adapters.HTTPAdapter(
-            pool_connections=10,
-            pool_maxsize=20,
-            max_retries=3,
-            pool_block=False
-        )
-        self.session.mount('http://', adapter)
-        self.session.mount('https://', adapter)
+        # 使用进程内共享的HTTP会话，连接跨视频复用（优先 HTTP/2）
+        # 使用 OpenAI 翻译时首次创建会话即在后台预热连接
+        warm_url = self.api_settings.get('base_url') if self.engine == "OpenAI Translate" else None
+        self.session = get_shared_openai_session(self.api_settings.get('api_key', ''), warm_url)
         
         # 语音识别器 - 使用单例模式的 Parakeet MLX
         # 注意：不在这里初始化，而是在需要时获取单例实例
@@ -187,31 +971,23 @@ class VideoProcessor(QRunnable):
         return f"{minutes:02d}:{seconds:02d}"
 
     def _is_apple_silicon(self) -> bool:
-        """检测是否是Apple Silicon"""
-        if platform.system() != 'Darwin':
-            return False
-        try:
-            result = subprocess.run(['sysctl', '-n', 'hw.optional.arm64'], 
-                                  capture_output=True, text=True, timeout=5)
-            return result.returncode == 0 and result.stdout.strip() == '1'
-        except Exception:
-            return False
+        """检测是否是Apple Silicon（结果在进程内缓存）"""
+        return detect_apple_silicon()
 
     def _check_hardware_acceleration(self) -> bool:
-        """检查VideoToolbox硬件加速支持"""
+        """检查VideoToolbox硬件加速支持（结果在进程内缓存）"""
         if platform.system() != 'Darwin':
             return False
-        try:
-            ffmpeg_path = self.get_ffmpeg_path()
-            if not ffmpeg_path:
-                return False
-            result = subprocess.run([ffmpeg_path, '-version'], 
-                                  capture_output=True, text=True, timeout=5)
-            return result.returncode == 0 and 'videotoolbox' in result.stdout.lower()
-        except Exception:
+        ffmpeg_path = self.get_ffmpeg_path()
+        if not ffmpeg_path:
             return False
+        return detect_videotoolbox(ffmpeg_path)
 
     def report_progress(self, progress):
+        # 进度没有变化时不再跨线程发送 Qt 信号（分批翻译、烧录等阶段会频繁报告同一进度）
+        if progress == self._last_progress:
+            return
+        self._last_progress = progress
         self.signals.file_progress.emit(self.base_name, progress)
         if self.progress_callback:
             self.progress_callback(self.base_name, progress)
@@ -238,14 +1014,13 @@ class VideoProcessor(QRunnable):
 
             # Generate Subtitle (10-70%)
             self.report_status("Recognizing speech...")
-            self.generate_subtitles(cache_paths['audio'], cache_paths['srt'])
+            # 识别结果直接在内存中交给翻译，_en.txt 只作为导出文件写入，不再读回
+            srt_content = self.generate_subtitles(cache_paths['audio'], cache_paths['srt'])
             self.logger.info("Subtitle generation complete")
             self.report_progress(70)
 
             # Translate Subtitle (70-80%)
             self.report_status("Translating subtitles...")
-            with open(cache_paths['srt'], "r", encoding="utf-8") as f:
-                lines = f.readlines()
 
             # Short-circuit: if user chose to skip translation, finish after generating _en.txt
             skip_translation = self.api_settings.get('skip_translation', False)
@@ -256,7 +1031,7 @@ class VideoProcessor(QRunnable):
                 self.signals.finished.emit()
                 return
 
-            translated_content = self.translate_subtitles(lines)
+            translated_content = self.translate_subtitles(srt_content)
             
             # Check if bilingual subtitles are empty before proceeding
             if not translated_content or translated_content.strip() == "":
@@ -305,9 +1080,7 @@ class VideoProcessor(QRunnable):
             
             # 确保资源被正确关闭
             try:
-                if hasattr(self, 'session'):
-                    self.session.close()
-                    
+                # 注意：OpenAI 会话在进程内共享，不随单个视频关闭
                 # 注意：不再需要释放语音识别器内存，因为使用单例模式
                 # MLX 模型会在应用程序退出时自动清理
                     
@@ -331,10 +1104,20 @@ class VideoProcessor(QRunnable):
             )
         }
 
+    # 已找到的 ffmpeg 路径（只缓存找到的结果，用户安装 ffmpeg 后无需重启即可生效）
+    _ffmpeg_path = None
+
     @staticmethod
     def get_ffmpeg_path():
+        """获取 ffmpeg 路径，找到后在进程内缓存"""
+        if VideoProcessor._ffmpeg_path is None:
+            VideoProcessor._ffmpeg_path = VideoProcessor._find_ffmpeg_path()
+        return VideoProcessor._ffmpeg_path
+
+    @staticmethod
+    def _find_ffmpeg_path():
         """
-        获取 ffmpeg 路径
+        查找 ffmpeg 路径
         - 打包环境：使用内置的 ffmpeg
         - 开发环境：使用系统安装的 ffmpeg
         """
@@ -380,13 +1163,15 @@ class VideoProcessor(QRunnable):
         if not ffmpeg_path:
             return False
             
+        has_audio = probe_has_audio(ffmpeg_path, self.video_path)
+        if has_audio is not None:
+            return has_audio
+        
         try:
-            cmd = [ffmpeg_path, "-i", self.video_path, "-hide_banner", "-f", "null", "-"]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)  # 增加到60秒
-            
-            # 检查stderr输出中是否有音频流信息
-            stderr_output = result.stderr.lower()
-            return "audio:" in stderr_output or "stream #" in stderr_output and ("audio" in stderr_output or "mp3" in stderr_output or "aac" in stderr_output or "wav" in stderr_output)
+            # 没有 ffprobe/PyAV 时退回 ffmpeg：不指定输出，只读取文件头打印流信息后退出，不做解码
+            cmd = [ffmpeg_path, "-hide_banner", "-i", self.video_path]
+            result = subprocess.run(cmd, stdin=subprocess.DEVNULL, capture_output=True, text=True, timeout=30)
+            return re.search(r"Stream #\S+.*: Audio:", result.stderr) is not None
         except subprocess.TimeoutExpired:
             self.logger.warning(f"Audio stream check timed out for large file: {self.base_name}")
             return True  # 对于大文件，假设有音频流
@@ -415,33 +1200,38 @@ class VideoProcessor(QRunnable):
             self.logger.warning("Video file has no audio streams, creating empty audio file")
             # 创建一个短暂的静音音频文件
             try:
-                cmd = [ffmpeg_path, "-f", "lavfi", "-i", "anullsrc=r=16000:cl=mono", "-t", "0.1", "-q:a", "0", audio_path, "-y"]
-                subprocess.run(cmd, capture_output=True, text=True, check=True, timeout=30)
+                cmd = [ffmpeg_path, "-loglevel", "error", "-f", "lavfi", "-i", "anullsrc=r=16000:cl=mono", "-t", "0.1", "-q:a", "0", audio_path, "-y"]
+                run_ffmpeg_quiet(cmd, timeout=30)
                 return True
             except Exception as e:
                 self.logger.error(f"Failed to create silent audio file: {e}")
                 raise RuntimeError("Video has no audio and failed to create silent audio file")
+        
+        # 优先用 PyAV 在进程内提取，失败（例如不支持的容器）时回退到 ffmpeg 子进程
+        if av is not None:
+            try:
+                if extract_audio_with_pyav(self.video_path, audio_path) > 0:
+                    self.logger.info("Audio extraction completed successfully (PyAV)")
+                    return True
+                self.logger.warning("PyAV produced no audio samples, falling back to ffmpeg")
+            except Exception as e:
+                self.logger.warning(f"PyAV audio extraction failed, falling back to ffmpeg: {e}")
             
         try:
-            # 使用系统优化的硬件加速参数
-            cmd = [ffmpeg_path]
-            
-            # 添加硬件加速（如果可用）
-            if self.use_hardware_accel:
-                cmd.extend(["-hwaccel", "videotoolbox"])
-                self.logger.info("Using VideoToolbox hardware acceleration for audio extraction")
+            # 只处理音轨：不初始化 VideoToolbox，也不为视频/字幕/数据流打开解码器
+            cmd = [ffmpeg_path, "-hide_banner", "-loglevel", "error", "-vn", "-sn", "-dn"]
             
             cmd.extend([
                 "-i", self.video_path,
                 "-q:a", "0",
-                "-map", "a",
+                "-map", "a:0",
                 "-ac", "1",  # 转换为单声道以减少文件大小
                 "-ar", "16000",  # 降低采样率，对语音识别足够
                 audio_path,
                 "-y"
             ])
             
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True, timeout=300)
+            run_ffmpeg_quiet(cmd, timeout=300)
             
             self.logger.info("Audio extraction completed successfully")
             
@@ -457,8 +1247,8 @@ class VideoProcessor(QRunnable):
             if "no such file or directory" not in str(e.stderr).lower():
                 try:
                     self.logger.warning("Audio extraction failed, attempting to create silent audio file")
-                    cmd = [ffmpeg_path, "-f", "lavfi", "-i", "anullsrc=r=16000:cl=mono", "-t", "0.1", "-q:a", "0", audio_path, "-y"]
-                    subprocess.run(cmd, capture_output=True, text=True, check=True, timeout=30)
+                    cmd = [ffmpeg_path, "-loglevel", "error", "-f", "lavfi", "-i", "anullsrc=r=16000:cl=mono", "-t", "0.1", "-q:a", "0", audio_path, "-y"]
+                    run_ffmpeg_quiet(cmd, timeout=30)
                     return True
                 except Exception:
                     pass
@@ -468,7 +1258,7 @@ class VideoProcessor(QRunnable):
             raise RuntimeError(error_msg)
 
     def generate_subtitles(self, audio_path, srt_path):
-        """使用 Parakeet MLX 生成字幕 - 使用单例模式"""
+        """使用 Parakeet MLX 生成字幕 - 使用单例模式，写入 srt_path 并返回 SRT 内容"""
         # 获取单例语音识别器
         try:
             self.logger.info("Getting Parakeet MLX speech recognizer instance...")
@@ -506,7 +1296,7 @@ class VideoProcessor(QRunnable):
                 self.logger.info("Audio file is very small, likely silent - creating empty subtitle file")
                 with open(srt_path, "w", encoding="utf-8") as f:
                     f.write("")  # 创建空字幕文件
-                return
+                return ""
             
             # 定义进度回调函数 - 语音识别占用20%-70%的进度空间（50%的进度空间）
             def progress_callback(current_chunk, total_chunks):
@@ -536,56 +1326,20 @@ class VideoProcessor(QRunnable):
             # 统计生成的字幕段数
             segment_count = len(result.sentences)
             self.logger.info(f"Transcription completed, generated {segment_count} segments")
+            return srt_content
             
         except Exception as e:
             self.logger.error(f"Transcription failed: {str(e)}")
             raise RuntimeError(f"Transcription failed: {str(e)}")
 
-    def translate_subtitles(self, lines):
+    def translate_subtitles(self, content):
         try:
             # 检查是否为空字幕文件
-            if not lines or all(not line.strip() for line in lines):
+            if not content or not content.strip():
                 self.logger.info("Empty subtitle file detected, skipping translation")
                 return ""
             
-            entries = []
-            current_id = None
-            current_timestamp = ""
-            current_text = []
-            parsing_state = "id"  # 可能的状态: id, timestamp, text
-
-            for line in lines:
-                line = line.strip()
-                if not line:  # 空行表示一个字幕条目结束
-                    if current_id is not None and current_timestamp and current_text:
-                        entries.append({
-                            'id': current_id,
-                            'timestamp': current_timestamp,
-                            'text': '\n'.join(current_text)
-                        })
-                    # 重置状态为解析新条目的ID
-                    current_id = None
-                    current_timestamp = ""
-                    current_text = []
-                    parsing_state = "id"
-                    continue
-                
-                if parsing_state == "id" and line.isdigit():
-                    current_id = int(line)
-                    parsing_state = "timestamp"
-                elif parsing_state == "timestamp" and '-->' in line:
-                    current_timestamp = line
-                    parsing_state = "text"
-                elif parsing_state == "text":
-                    current_text.append(line)
-
-            # 处理文件末尾可能存在的最后一个条目
-            if current_id is not None and current_timestamp and current_text:
-                entries.append({
-                    'id': current_id,
-                    'timestamp': current_timestamp,
-                    'text': '\n'.join(current_text)
-                })
+            entries = parse_srt_entries(content)
 
             total_entries = len(entries)
             if total_entries == 0:
@@ -600,25 +1354,26 @@ class VideoProcessor(QRunnable):
             self.report_progress(80)
 
             # Sort by ID to Ensure Correct Subtitle Ordering
-            translated_entries.sort(key=lambda x: x['id'])
+            translated_entries.sort(key=operator.itemgetter('id'))  # 输入已按顺序时为 O(n)
 
             # Construct Final Subtitle Content
-            translated_content = ""
-            for entry in translated_entries:
-                translated_content += f"{entry['id']}\n{entry['timestamp']}\n{entry['text']}\n\n"
-
-            return translated_content
+            # 一次性拼接，避免逐条 += 反复重建字符串
+            return "".join(
+                f"{entry['id']}\n{entry['timestamp']}\n{entry['text']}\n\n" for entry in translated_entries
+            )
 
         except Exception as e:
             self.signals.error.emit(f"Translation Process Failed: {str(e)}")
             raise
 
     def _batch_translate_all(self, entries):
-        """批量翻译所有字幕条目"""
+        """批量翻译所有字幕条目（已缓存的译文直接复用）"""
         if self.engine == "OpenAI Translate":
-            return self._batch_translate_with_openai(entries)
+            translate_func = self._batch_translate_with_openai
         else:  # Google Translation
-            return self._batch_translate_with_google(entries)
+            translate_func = self._batch_translate_with_google
+        namespace = translation_cache_namespace(self.engine, self.api_settings)
+        return translate_with_cache(self.cache_dir, namespace, entries, translate_func)
     
     """
     外部调用
@@ -632,7 +1387,7 @@ class VideoProcessor(QRunnable):
     """
 
     def _batch_translate_with_openai(self, entries):
-        """使用OpenAI API批量翻译所有字幕 - 使用段落分隔符方案"""
+        """使用OpenAI API批量翻译所有字幕 - 使用 JSON 数组批量方案"""
         try:
             # 从配置文件获取批处理参数
             max_chars_per_batch = self.api_settings.get("max_chars_per_batch", OPENAI_MAX_CHARS_PER_BATCH)
@@ -654,13 +1409,14 @@ class VideoProcessor(QRunnable):
             raise
     
     def _translate_openai_batch(self, entries):
-        """OpenAI单批次翻译 - 使用段落分隔符方案 - 带重试机制"""
+        """OpenAI单批次翻译 - 使用 JSON 数组批量方案 - 带重试机制"""
         @exponential_backoff_retry
         def _make_api_request():
             """实际的API请求函数，支持重试"""
-            response = self.session.post(
+            response = post_json(
+                self.session,
                 f"{self.api_settings['base_url']}/v1/chat/completions",
-                json=data,
+                data,
                 timeout=300
             )
             
@@ -673,37 +1429,17 @@ class VideoProcessor(QRunnable):
                         raise ContentFilteredException(f"Content filtered by OpenAI: {error_text}")
                     else:
                         raise requests.exceptions.RequestException(f"OpenAI API error: {response.status_code} - {error_text}")
-                elif response.status_code in {429, 500, 502, 503, 504}:
-                    # 这些状态码可以重试
-                    raise RetryableAPIException(f"OpenAI API error: {response.status_code} - {error_text}")
+                elif response.status_code in RETRYABLE_STATUS_CODES:
+                    # 这些状态码可以重试，按服务端的 Retry-After 等待
+                    raise RetryableAPIException(f"OpenAI API error: {response.status_code} - {error_text}",
+                                                retry_after=parse_retry_after(response.headers.get('Retry-After')))
                 else:
                     raise requests.exceptions.RequestException(f"OpenAI API error: {response.status_code} - {error_text}")
             
-            return response.json()
+            return parse_json_response(response)
 
-        # 构建翻译文本 - 使用 %% 分隔符
-        if len(entries) == 1:
-            # 单段落，直接翻译
-            text_to_translate = entries[0]['text']
-        else:
-            # 多段落，使用 %% 分隔
-            texts = [entry['text'] for entry in entries]
-            text_to_translate = '\n%%\n'.join(texts)
-        
-        # 使用配置文件中的自定义prompt
-        system_prompt = OPENAI_CUSTOM_PROMPT
-
-        user_prompt = f"Translate to Chinese (output translation only):\n\n{text_to_translate}"
-        
-        data = {
-            "model": self.api_settings.get("model", OPENAI_MODEL),
-            "messages": [
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
-            "temperature": 0,
-            "max_tokens": 8000  # 适中的token限制
-        }
+        # 构建请求体 - 单段落直接翻译，多段落使用 JSON 数组
+        data = build_openai_chat_payload(self.api_settings.get("model", OPENAI_MODEL), [entry['text'] for entry in entries])
 
         try:
             # 使用重试机制进行API请求
@@ -727,36 +1463,18 @@ class VideoProcessor(QRunnable):
                 # 单段落
                 translated_texts = [translated_content]
             else:
-                # 多段落，按 %% 分割
-                if '\n%%\n' in translated_content:
-                    translated_texts = translated_content.split('\n%%\n')
-                elif '%%' in translated_content:
-                    translated_texts = translated_content.split('%%')
-                else:
-                    # 如果没有找到分隔符，可能是单个翻译结果，按行数分割
-                    lines = translated_content.split('\n')
-                    if len(lines) >= len(entries):
-                        translated_texts = lines[:len(entries)]
-                    else:
-                        translated_texts = [translated_content]  # 使用整个翻译作为第一个结果
-            
-            # 确保翻译结果数量匹配
-            while len(translated_texts) < len(entries):
-                translated_texts.append(entries[len(translated_texts)]['text'])  # 使用原文填充
-            translated_texts = translated_texts[:len(entries)]  # 截断多余的结果
-            
-            # 构建最终结果
-            translated_entries = []
-            for i, entry in enumerate(entries):
-                translated_text = translated_texts[i].strip() if i < len(translated_texts) else entry['text']
-                if not translated_text:
-                    translated_text = entry['text']  # 如果翻译为空，使用原文
-                
-                translated_entries.append({
-                    'id': entry['id'],
-                    'timestamp': entry['timestamp'],
-                    'text': f"{entry['text']}\n{translated_text}"
-                })
+                # 多段落，解析 JSON 数组；条数不一致时拆成小批次重试，避免译文错位又不必逐条请求
+                translated_texts = parse_openai_json_translations(translated_content, len(entries))
+                if translated_texts is None:
+                    sub_batches = split_fallback_batches(entries)
+                    self.logger.warning(f"JSON translation result malformed or count mismatch, retrying in {len(sub_batches)} smaller batches")
+                    translated_entries = []
+                    for sub_batch in sub_batches:
+                        translated_entries.extend(self._translate_openai_batch(sub_batch))
+                    return translated_entries
+            
+            # 构建最终结果（如果翻译为空，使用原文）
+            translated_entries = pair_bilingual_entries(entries, translated_texts)
             
             self.logger.info(f"Successfully translated {len(translated_entries)} entries via OpenAI paragraph batch")
             return translated_entries
@@ -764,17 +1482,11 @@ class VideoProcessor(QRunnable):
         except ContentFilteredException as e:
             self.logger.warning(f"Content filtered by OpenAI safety system: {str(e)}")
             # 检查是否启用 Google 降级
-            try:
-                from config import ENABLE_GOOGLE_FALLBACK
-                google_fallback_enabled = ENABLE_GOOGLE_FALLBACK
-            except ImportError:
-                google_fallback_enabled = True  # 默认启用
-            
-            if google_fallback_enabled:
+            if ENABLE_GOOGLE_FALLBACK:
                 # 对于内容过滤，尝试使用 Google Translate 作为降级方案
                 self.logger.info("Falling back to Google Translate for filtered content...")
                 try:
-                    return self._translate_google_batch(entries, "\n🔸🔸🔸\n")
+                    return self._translate_google_batch(entries)
                 except Exception as google_error:
                     self.logger.error(f"Google Translate fallback also failed: {str(google_error)}")
                     # 如果 Google 翻译也失败，返回原文但标记为已处理
@@ -800,17 +1512,11 @@ class VideoProcessor(QRunnable):
         except Exception as e:
             self.logger.error(f"OpenAI translation failed after retries: {str(e)}")
             # 检查是否启用 Google 降级
-            try:
-                from config import ENABLE_GOOGLE_FALLBACK
-                google_fallback_enabled = ENABLE_GOOGLE_FALLBACK
-            except ImportError:
-                google_fallback_enabled = True  # 默认启用
-            
-            if google_fallback_enabled:
+            if ENABLE_GOOGLE_FALLBACK:
                 # 对于其他错误，尝试使用 Google Translate 作为降级方案
                 self.logger.info("Falling back to Google Translate after OpenAI failure...")
                 try:
-                    return self._translate_google_batch(entries, "\n🔸🔸🔸\n")
+                    return self._translate_google_batch(entries)
                 except Exception as google_error:
                     self.logger.error(f"Google Translate fallback also failed: {str(google_error)}")
                     # 如果 Google 翻译也失败，返回原文
@@ -834,7 +1540,7 @@ class VideoProcessor(QRunnable):
                 return fallback_entries
     
     def _translate_openai_multiple_batches(self, entries, max_chars=None, max_entries=None):
-        """OpenAI多批次翻译 - 使用段落分隔符方案"""
+        """OpenAI多批次翻译 - 使用 JSON 数组批量方案"""
         # 使用传入的参数或默认配置值
         if max_chars is None:
             max_chars = OPENAI_MAX_CHARS_PER_BATCH
@@ -866,178 +1572,231 @@ class VideoProcessor(QRunnable):
         
         self.logger.info(f"Split into {len(batches)} batches for OpenAI paragraph translation")
         
-        # 逐批次翻译
+        # 条目很多且启用了 Batch API 时先整体提交，未成功的批次再走常规并发请求
+        translated_batches = [None] * len(batches)
+        if OPENAI_USE_BATCH_API and len(entries) >= OPENAI_BATCH_API_MIN_ENTRIES:
+            translated_batches = self._translate_openai_via_batch_api(batches)
+        
+        # 并发翻译各批次，按批次顺序合并结果
+        pending = [i for i, translated_batch in enumerate(translated_batches) if translated_batch is None]
+        if pending:
+            results = asyncio.run(self._translate_openai_batches_concurrently([batches[i] for i in pending]))
+            for i, translated_batch in zip(pending, results):
+                translated_batches[i] = translated_batch
+        for translated_batch in translated_batches:
+            all_translated.extend(translated_batch)
+        
+        self.logger.info(f"Completed OpenAI paragraph translation: {len(all_translated)} entries")
+        return all_translated
+    
+    def _translate_openai_via_batch_api(self, batches):
+        """通过 OpenAI Batch API 翻译所有批次，返回与 batches 对齐的结果列表，未成功的批次为 None"""
+        model = self.api_settings.get("model", OPENAI_MODEL)
+        payloads = [build_openai_chat_payload(model, [entry['text'] for entry in batch]) for batch in batches]
+        
+        def _on_status(batch_info):
+            counts = batch_info.get('request_counts') or {}
+            self.report_status(f"Waiting for OpenAI batch ({counts.get('completed', 0)}/{len(batches)})...")
+        
+        self.logger.info(f"Submitting {len(batches)} batches to OpenAI Batch API")
+        try:
+            bodies = run_openai_batch_api(self.session, self.api_settings['base_url'], payloads, _on_status)
+        except Exception as e:
+            self.logger.warning(f"OpenAI Batch API failed ({str(e)}), falling back to regular requests")
+            return [None] * len(batches)
+        
+        translated_batches = []
         for i, batch in enumerate(batches):
+            translated_texts = extract_openai_translations(bodies.get(i), len(batch))
+            translated_batches.append(None if translated_texts is None else pair_bilingual_entries(batch, translated_texts))
+        
+        failed_count = translated_batches.count(None)
+        if failed_count:
+            self.logger.warning(f"{failed_count}/{len(batches)} batches missing from OpenAI Batch API output, retrying with regular requests")
+        return translated_batches
+    
+    async def _translate_openai_batches_concurrently(self, batches):
+        """在事件循环中并发执行各批次的请求（在途数按响应耗时自适应调整），返回按批次顺序排列的结果"""
+        limiter = create_openai_limiter(self.api_settings['base_url'])
+        completed = 0
+        
+        async def _translate_one(i, batch):
+            nonlocal completed
+            await limiter.acquire()
+            started = time.monotonic()
+            success = True
             try:
                 self.logger.info(f"Translating batch {i+1}/{len(batches)} with {len(batch)} entries")
-                
-                # 使用单批次翻译函数
-                translated_batch = self._translate_openai_batch(batch)
-                all_translated.extend(translated_batch)
-                
-                # 发出进度信号 - 使用正确的进度报告方法
-                progress = 72 + int((i + 1) / len(batches) * 8)
-                self.report_progress(min(80, progress))
-                
-                # 批次间适当延迟，避免API限制
-                if i < len(batches) - 1:
-                    time.sleep(0.1)
-                    
+                # 请求、重试和 Google 降级逻辑都是同步的，放到线程中执行，不阻塞事件循环
+                translated_batch = await asyncio.to_thread(self._translate_openai_batch, batch)
             except Exception as e:
+                success = False
                 self.logger.error(f"Failed to translate batch {i+1}: {str(e)}")
                 # 如果批次翻译失败，保留原文
-                failed_batch = []
-                for entry in batch:
-                    failed_batch.append({
+                translated_batch = [
+                    {
                         'id': entry['id'],
                         'timestamp': entry['timestamp'],
                         'text': entry['text']  # 保持原文
-                    })
-                all_translated.extend(failed_batch)
+                    }
+                    for entry in batch
+                ]
+            finally:
+                await limiter.release(time.monotonic() - started, success)
+            
+            # 按完成的批次数报告进度
+            completed += 1
+            progress = 72 + int(completed / len(batches) * 8)
+            self.report_progress(min(80, progress))
+            return translated_batch
         
-        self.logger.info(f"Completed OpenAI paragraph translation: {len(all_translated)} entries")
-        return all_translated
+        try:
+            return await asyncio.gather(*(_translate_one(i, batch) for i, batch in enumerate(batches)))
+        finally:
+            remember_openai_limiter(self.api_settings['base_url'], limiter)
     
     def _batch_translate_with_google(self, entries):
         """使用Google Translate批量翻译所有字幕，支持分批处理大文本"""
         try:
-            # 使用不会被翻译的特殊Unicode分隔符
-            separator = "\n🔸🔸🔸\n"  # 使用特殊符号，Google Translate不会翻译
+            # 每个条目额外占用的编号哨兵长度，例如 "\n@@12@@ "
+            sentinel_length = GOOGLE_SENTINEL_LENGTH
             max_chars = OPENAI_MAX_CHARS_PER_BATCH  # 留一些余量，避免超过5000字符限制
-            translated_entries = []
             
-            # 分批处理字幕条目
+            # 先按字符数把字幕条目分批
+            batches = []
             current_batch = []
             current_length = 0
-            batch_count = 0
-            
-            # 先计算总批次数以便显示进度
-            total_batches = 1
-            temp_length = 0
-            for entry in entries:
-                entry_length = len(entry['text']) + len(separator)
-                if temp_length + entry_length > max_chars and temp_length > 0:
-                    total_batches += 1
-                    temp_length = entry_length
-                else:
-                    temp_length += entry_length
-            
             for entry in entries:
-                entry_text = entry['text']
-                entry_length = len(entry_text) + len(separator)
-                
-                # 如果添加当前条目会超过限制，先处理当前批次
+                entry_length = len(entry['text']) + sentinel_length
                 if current_length + entry_length > max_chars and current_batch:
-                    batch_count += 1
-                    self.logger.info(f"Processing Google Translate batch {batch_count}/{total_batches} ({len(current_batch)} entries, {current_length} chars)")
-                    
-                    # 更新进度 (72% -> 80% 的范围内)
-                    progress = 72 + int((batch_count / total_batches) * 8)
-                    self.report_progress(min(80, progress))
-                    
-                    batch_results = self._translate_google_batch(current_batch, separator)
-                    translated_entries.extend(batch_results)
-                    
-                    # 重置批次
+                    batches.append(current_batch)
                     current_batch = []
                     current_length = 0
-                
                 current_batch.append(entry)
                 current_length += entry_length
-            
-            # 处理最后一批
             if current_batch:
-                batch_count += 1
-                self.logger.info(f"Processing final Google Translate batch {batch_count}/{total_batches} ({len(current_batch)} entries, {current_length} chars)")
-                batch_results = self._translate_google_batch(current_batch, separator)
-                translated_entries.extend(batch_results)
+                batches.append(current_batch)
+            total_batches = len(batches)
+            
+            # 安装了 aiohttp 时并发发送所有批次，否则逐批同步翻译
+            if aiohttp is not None and total_batches > 1:
+                translated_entries = self._translate_google_batches_concurrently(batches)
+            else:
+                translated_entries = []
+                for batch_count, batch in enumerate(batches, 1):
+                    self.logger.info(f"Processing Google Translate batch {batch_count}/{total_batches} ({len(batch)} entries)")
+                    
+                    # 更新进度 (72% -> 80% 的范围内)
+                    progress = 72 + int((batch_count / total_batches) * 8)
+                    self.report_progress(min(80, progress))
+                    
+                    translated_entries.extend(self._translate_google_batch(batch))
             
-            self.logger.info(f"Successfully translated {len(translated_entries)} entries via Google Translate in {batch_count} batches")
+            self.logger.info(f"Successfully translated {len(translated_entries)} entries via Google Translate in {total_batches} batches")
             return translated_entries
             
         except Exception as e:
             self.logger.error(f"Google Translate batch translation failed: {str(e)}")
             raise
     
-    def _translate_google_batch(self, entries, separator):
-        """翻译一个批次的字幕条目 - 改进的分隔符处理"""
-        # 提取所有需要翻译的文本
-        texts_to_translate = [entry['text'] for entry in entries]
+    def _translate_google_batches_concurrently(self, batches):
+        """通过 aiohttp 并发翻译所有批次，失败的批次回退到同步翻译"""
+        self.logger.info(f"Sending {len(batches)} Google Translate batches concurrently")
+        prepared = [build_google_batch_text(batch) for batch in batches]
+        responses = asyncio.run(translate_google_texts_async([combined_text for _, combined_text in prepared]))
+        self.report_progress(80)
+        
+        translated_entries = []
+        for batch, (unique_texts, _), response in zip(batches, prepared, responses):
+            if isinstance(response, Exception) or not response:
+                self.logger.warning(f"Concurrent Google batch failed ({response!r}), retrying synchronously")
+                translated_entries.extend(self._translate_google_batch(batch))
+            else:
+                translated_entries.extend(self._merge_google_batch(batch, unique_texts, response))
+        return translated_entries
+    
+    def _translate_google_batch(self, entries):
+        """翻译一个批次的字幕条目 - 使用编号哨兵对齐译文"""
+        unique_texts, combined_text = build_google_batch_text(entries)
         
-        # 使用分隔符将所有文本合并成一个大字符串
-        combined_text = separator.join(texts_to_translate)
+        # 使用Deep Translator进行批量翻译（复用当前线程的翻译器实例）
+        translator = get_google_translator()
         
-        # 使用Deep Translator进行批量翻译
-        from deep_translator import GoogleTranslator
-        translator = GoogleTranslator(source='auto', target='zh-CN')
-        translated_combined = translator.translate(combined_text)
+        def _request_translation():
+            translated = translator.translate(combined_text)
+            if not translated:
+                raise RetryableAPIException("Empty response from Google Translate")
+            return translated
+        
+        # 空响应和 429 等临时错误按指数退避重试，仍失败时逐条翻译，避免整批丢失
+        try:
+            translated_combined = exponential_backoff_retry(_request_translation)()
+        except Exception as e:
+            self.logger.warning(f"Google batch translation failed after retries ({str(e)}), translating entries individually")
+            return self._translate_google_individually(entries, unique_texts)
         
+        return self._merge_google_batch(entries, unique_texts, translated_combined)
+    
+    def _translate_google_individually(self, entries, unique_texts):
+        """逐条翻译（批量翻译失败时的尽力回退），单条失败时保留原文"""
+        tx_map, failed_count = translate_google_texts_individually(unique_texts)
+        
+        if failed_count:
+            self.logger.warning(f"{failed_count}/{len(unique_texts)} entries failed individual translation, keeping original text")
+        
+        return build_bilingual_entries(entries, tx_map)
+    
+    def _merge_google_batch(self, entries, unique_texts, translated_combined):
+        """按编号哨兵解析一个批次的译文，并构建双语字幕条目"""
         if not translated_combined:
             raise ValueError("Empty response from Google Translate")
         
-        # 尝试按分隔符分割翻译结果
-        translated_texts = translated_combined.split(separator)
-        
-        # 如果分隔符被破坏，尝试智能恢复
-        if len(translated_texts) != len(entries):
-            self.logger.warning(f"Translation count mismatch: expected {len(entries)}, got {len(translated_texts)}")
-            
-            # 尝试其他可能的分隔符变体
-            alternate_separators = [
-                "\n🔸🔸🔸\n",
-                "🔸🔸🔸",
-                "\n🔸🔸\n", 
-                "🔸🔸",
-                "\n"
-            ]
-            
-            for alt_sep in alternate_separators:
-                alt_split = translated_combined.split(alt_sep)
-                if len(alt_split) == len(entries):
-                    self.logger.info(f"Successfully recovered using alternate separator: '{alt_sep}'")
-                    translated_texts = alt_split
-                    break
-            
-            # 如果还是不匹配，尝试按行数分割
-            if len(translated_texts) != len(entries):
-                lines = translated_combined.split('\n')
-                if len(lines) >= len(entries):
-                    # 尝试均匀分配行
-                    lines_per_entry = len(lines) // len(entries)
-                    translated_texts = []
-                    for i in range(len(entries)):
-                        start_idx = i * lines_per_entry
-                        end_idx = start_idx + lines_per_entry if i < len(entries) - 1 else len(lines)
-                        entry_text = '\n'.join(lines[start_idx:end_idx]).strip()
-                        translated_texts.append(entry_text)
-                    self.logger.info(f"Recovered by splitting {len(lines)} lines into {len(entries)} entries")
-            
-            # 最后的保险措施：填充或截断
-            if len(translated_texts) < len(entries):
-                # 如果翻译结果太少，用原文填充
-                while len(translated_texts) < len(entries):
-                    missing_idx = len(translated_texts)
-                    translated_texts.append(entries[missing_idx]['text'])
-                self.logger.warning(f"Padded missing translations with original text")
-            elif len(translated_texts) > len(entries):
-                # 如果翻译结果太多，截断多余部分
-                translated_texts = translated_texts[:len(entries)]
-                self.logger.warning(f"Truncated excess translations")
-        
-        # 构建翻译结果
-        batch_results = []
-        for i, entry in enumerate(entries):
-            translated_text = translated_texts[i].strip() if i < len(translated_texts) else ""
-            if not translated_text:
-                translated_text = entry['text']  # 如果翻译失败，使用原文
-            
-            batch_results.append({
-                'id': entry['id'],
-                'timestamp': entry['timestamp'],
-                'text': f"{entry['text']}\n{translated_text}"
-            })
+        # 按编号解析翻译结果，写入预分配的列表
+        translated_texts = [None] * len(unique_texts)
+        for idx, text in GOOGLE_SENTINEL_PATTERN.findall(translated_combined):
+            idx = int(idx)
+            if idx < len(translated_texts):
+                translated_texts[idx] = text.strip()
+        
+        # 缺失的编号单独回退为原文，不影响其他条目
+        missing_count = translated_texts.count(None)
+        if missing_count:
+            self.logger.warning(f"Translation count mismatch: {missing_count}/{len(unique_texts)} entries missing, keeping original text")
         
-        return batch_results
+        # 原文 -> 译文映射，重复行共享同一译文
+        return build_bilingual_entries(entries, dict(zip(unique_texts, translated_texts)))
+
+    @staticmethod
+    def escape_filter_path(path):
+        """
+        转义 -vf 中 subtitles 滤镜的文件路径
+        路径先作为滤镜选项值转义（\\ ' :），再作为滤镜图转义（\\ ' [ ] , ;），
+        路径中含有撇号、冒号等字符时 ffmpeg 也能正确解析
+        """
+        option_escaped = FFMPEG_OPTION_ESCAPE_PATTERN.sub(r'\\\g<0>', path)
+        return FFMPEG_GRAPH_ESCAPE_PATTERN.sub(r'\\\g<0>', option_escaped)
+
+    @staticmethod
+    def build_burn_command(ffmpeg_path, video_path, subtitle_path, output_path):
+        """构建字幕烧录的 ffmpeg 命令（多进程管理器的异步烧录也复用此命令）"""
+        # 优化的硬件加速字幕烧录命令，更激进的压缩
+        return [
+            ffmpeg_path,
+            "-hwaccel", "videotoolbox",
+            "-i", video_path,
+            "-vf", f"subtitles={VideoProcessor.escape_filter_path(subtitle_path)}:force_style='FontSize=16,PrimaryColour=&HFFFFFF,OutlineColour=&H000000,BorderStyle=4'",
+            "-c:v", "h264_videotoolbox",
+            "-q:v", "40", # VideoToolbox质量参数调整为55，更激进的压缩
+            "-c:a", "copy",
+            "-movflags", "+faststart",  # 优化在线播放
+            # 进度以 key=value 形式写到 stdout，stderr 只保留警告和错误
+            "-progress", "pipe:1",
+            "-nostats",
+            "-hide_banner",
+            "-loglevel", "warning",
+            output_path,
+            "-y"  # 覆盖已存在的文件
+        ]
 
     def burn_subtitles(self, subtitle_path, output_path):
         ffmpeg_path = self.get_ffmpeg_path()
@@ -1064,54 +1823,30 @@ class VideoProcessor(QRunnable):
         except Exception as e:
             raise ValueError(f"Error reading subtitle file {subtitle_path}: {str(e)}")
             
+        temp_path = temp_output_path(output_path)
         try:
-            # 优化的硬件加速字幕烧录命令，更激进的压缩
-            cmd = [
-                ffmpeg_path,
-                "-hwaccel", "videotoolbox",
-                "-i", self.video_path,
-                "-vf", f"subtitles='{subtitle_path}':force_style='FontSize=16,PrimaryColour=&HFFFFFF,OutlineColour=&H000000,BorderStyle=4'",
-                "-c:v", "h264_videotoolbox",
-                "-q:v", "40", # VideoToolbox质量参数调整为55，更激进的压缩
-                "-c:a", "copy",
-                "-movflags", "+faststart",  # 优化在线播放
-                output_path,
-                "-y"  # 覆盖已存在的文件
-            ]
-            
-            # 使用 Popen 来监控进度
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                universal_newlines=True
-            )
+            cmd = self.build_burn_command(ffmpeg_path, self.video_path, subtitle_path, temp_path)
+            
+            duration = probe_media_duration(ffmpeg_path, self.video_path)
             
-            # 监控进度 (80% -> 100%)
+            # 监控进度 (80% -> 100%)，按已编码时长 / 视频总时长计算
             progress_start = 80
             progress_range = 20
+            last_progress = [progress_start]
             
-            stderr_output = ""
-            while True:
-                output = process.stderr.readline()
-                if output == '' and process.poll() is not None:
-                    break
-                if output:
-                    stderr_output += output
-                    # 简单的进度估算，每秒增加一点进度
-                    current_progress = progress_start + min(progress_range, len(stderr_output) // 100)
-                    if current_progress > progress_start:
-                        self.report_progress(min(99, current_progress))
-            
-            # 等待进程完成
-            return_code = process.poll()
+            def on_progress(fraction):
+                current_progress = min(99, progress_start + int(fraction * progress_range))
+                if current_progress > last_progress[0]:
+                    last_progress[0] = current_progress
+                    self.report_progress(current_progress)
+            
+            # 在事件循环中监督 ffmpeg，不再额外占用线程读取 stderr
+            return_code, stderr_output = asyncio.run(run_ffmpeg_with_progress(cmd, duration, on_progress))
             if return_code != 0:
                 raise subprocess.CalledProcessError(return_code, cmd, stderr=stderr_output)
                 
-            # 验证输出文件
-            if not os.path.exists(output_path) or os.path.getsize(output_path) == 0:
-                raise RuntimeError("Video processing failed: output file is empty or missing")
+            # 验证输出文件并替换到最终路径
+            finalize_output_file(temp_path, output_path)
             
             self.logger.info("Video processing completed successfully")
             return True
@@ -1119,18 +1854,111 @@ class VideoProcessor(QRunnable):
             error_msg = f"Error during FFmpeg processing: {e.stderr}"
             self.logger.error(error_msg)
             raise RuntimeError(error_msg)
+        finally:
+            discard_temp_output(temp_path)
 
 
 # ===== 多进程支持函数 =====
 
+# 进度共享内存：每个任务占一个槽 (序号, 任务ID, 进度, 已用秒数)，槽位为 任务ID % PROGRESS_SLOT_COUNT。
+# 进度更新频繁且结构固定，直接写共享内存，不再经过 mp.Queue 的 pickle + 锁 + feeder 线程；
+# 序号为奇数表示正在写入（seqlock），读取方遇到奇数或前后序号不一致时跳过，下一次轮询再读
+PROGRESS_SLOT_SEQ = struct.Struct('<I')
+PROGRESS_SLOT_DATA = struct.Struct('<iii')
+PROGRESS_SLOT_SIZE = PROGRESS_SLOT_SEQ.size + PROGRESS_SLOT_DATA.size
+PROGRESS_SLOT_COUNT = 64  # 远大于同时运行的进程数，槽位不会被仍在运行的任务复用
+
+# 所有工作进程合计同时进行的语音识别数。每个工作进程各有一份模型，SpeechRecognizer 的 _model_lock
+# 只在进程内生效；不加跨进程限制时 N 个进程会同时在 GPU 上转录，互相争抢显存和算力
+MAX_ASR_JOBS = 1
+
+# 每个工作进程最多处理的任务数（相当于 maxtasksperchild）：达到后让它退出并按需启动新进程，
+# 模型只需在每 WORKER_MAX_TASKS 个视频重新加载一次，内存碎片和泄漏也不会随任务数无限增长
+WORKER_MAX_TASKS = 8
+
+
+class AsrSlot:
+    """工作进程使用的语音识别名额：共享信号量加上本进程是否持有名额的标记，进程异常退出时管理器据此归还名额"""
+    
+    def __init__(self, semaphore, held):
+        self.semaphore = semaphore
+        self.held = held
+    
+    def acquire(self, block: bool = True) -> bool:
+        if not self.semaphore.acquire(block):
+            return False
+        self.held.value = 1
+        return True
+    
+    def release(self):
+        self.held.value = 0
+        self.semaphore.release()
+
+
+def write_progress_slot(buf, task_id: int, progress: int, elapsed_seconds: int):
+    """工作进程写入自己的进度槽"""
+    offset = (task_id % PROGRESS_SLOT_COUNT) * PROGRESS_SLOT_SIZE
+    seq = PROGRESS_SLOT_SEQ.unpack_from(buf, offset)[0]
+    PROGRESS_SLOT_SEQ.pack_into(buf, offset, (seq + 1) & 0xFFFFFFFF)
+    PROGRESS_SLOT_DATA.pack_into(buf, offset + PROGRESS_SLOT_SEQ.size, task_id, progress, elapsed_seconds)
+    PROGRESS_SLOT_SEQ.pack_into(buf, offset, (seq + 2) & 0xFFFFFFFF)
+
+
+def read_progress_slot(buf, task_id: int) -> Optional[Tuple[int, int]]:
+    """读取任务的 (进度, 已用秒数)；槽位未写入、正在写入或属于其他任务时返回 None"""
+    offset = (task_id % PROGRESS_SLOT_COUNT) * PROGRESS_SLOT_SIZE
+    seq = PROGRESS_SLOT_SEQ.unpack_from(buf, offset)[0]
+    if seq == 0 or seq & 1:
+        return None
+    slot_task_id, progress, elapsed_seconds = PROGRESS_SLOT_DATA.unpack_from(buf, offset + PROGRESS_SLOT_SEQ.size)
+    if PROGRESS_SLOT_SEQ.unpack_from(buf, offset)[0] != seq or slot_task_id != task_id:
+        return None
+    return progress, elapsed_seconds
+
+
+# 工作进程中已读取的 API 设置 {共享内存名: 设置字典}
+_shared_api_settings_cache = {}
+
+
+def load_shared_api_settings(shm_name: str, size: int) -> Dict[str, Any]:
+    """从管理器创建的共享内存中读取 API 设置（每个进程只反序列化一次）"""
+    settings = _shared_api_settings_cache.get(shm_name)
+    if settings is None:
+        shm = shared_memory.SharedMemory(name=shm_name)
+        try:
+            settings = pickle.loads(bytes(shm.buf[:size]))
+        finally:
+            shm.close()
+        _shared_api_settings_cache[shm_name] = settings
+    return settings
+
+
+def apply_worker_config(settings: Dict[str, Any]):
+    """在工作进程中应用管理器提交任务时的设置，同时刷新本模块和语音识别模块导入时复制的配置值"""
+    apply_config_snapshot(settings)
+    for module in (sys.modules[__name__], sys.modules[SpeechRecognizer.__module__]):
+        for name, value in settings.items():
+            if hasattr(module, name):
+                setattr(module, name, value)
+
+
+def _exit_on_sigterm(signum, frame):
+    raise SystemExit(128 + signum)
+
+
 def process_video_worker(
     video_path: str,
     engine: str,
-    api_settings: Dict[str, Any],
+    api_settings_handle: Tuple[str, int],
     cache_dir: str,
     progress_queue: mp.Queue,
     result_queue: mp.Queue,
-    process_id: int
+    process_id: int,
+    defer_burning: bool = False,
+    progress_shm_name: Optional[str] = None,
+    asr_slot=None,
+    config_settings: Optional[Dict[str, Any]] = None,
+    openai_concurrency: Optional[Dict[str, Tuple[float, Optional[float]]]] = None
 ):
     """
     多进程视频处理工作函数
@@ -1138,13 +1966,27 @@ def process_video_worker(
     Args:
         video_path: 视频文件路径
         engine: 翻译引擎
-        api_settings: API设置
+        api_settings_handle: API设置所在共享内存的 (名称, 长度)
         cache_dir: 缓存目录
         progress_queue: 进度报告队列
         result_queue: 结果队列
         process_id: 进程ID
+        defer_burning: 是否把字幕烧录交给管理器异步执行
+        progress_shm_name: 进度共享内存名称（None 时通过进度队列报告进度）
+        asr_slot: 管理器分配的语音识别名额，限制所有工作进程同时进行的语音识别数（None 时不限制）
+        config_settings: 提交任务时主进程的设置（config_snapshot），None 时使用本进程导入 config 时读取的设置
+        openai_concurrency: 管理器汇总的 OpenAI 自适应并发状态，结果中返回本进程更新后的状态
     """
+    progress_shm = None
     try:
+        if config_settings is not None:
+            apply_worker_config(config_settings)
+        if openai_concurrency:
+            import_openai_concurrency_state(openai_concurrency)
+        api_settings = load_shared_api_settings(*api_settings_handle)
+        if progress_shm_name:
+            progress_shm = shared_memory.SharedMemory(name=progress_shm_name)
+        
         # 创建处理器实例（不继承QRunnable，直接使用核心功能）
         processor = VideoProcessorForMultiprocess(
             video_path=video_path,
@@ -1152,7 +1994,10 @@ def process_video_worker(
             api_settings=api_settings,
             cache_dir=cache_dir,
             progress_queue=progress_queue,
-            process_id=process_id
+            process_id=process_id,
+            defer_burning=defer_burning,
+            progress_slots=progress_shm.buf if progress_shm is not None else None,
+            asr_slot=asr_slot
         )
         
         # 执行处理
@@ -1163,7 +2008,8 @@ def process_video_worker(
             'process_id': process_id,
             'video_path': video_path,
             'status': 'success',
-            'result': result
+            'result': result,
+            'openai_concurrency': export_openai_concurrency_state()
         })
         
     except Exception as e:
@@ -1172,42 +2018,68 @@ def process_video_worker(
             'process_id': process_id,
             'video_path': video_path,
             'status': 'error',
-            'error': str(e)
+            'error': str(e),
+            'openai_concurrency': export_openai_concurrency_state()
         })
+    finally:
+        if progress_shm is not None:
+            progress_shm.close()
+
+
+def video_worker_loop(task_queue: mp.Queue, progress_queue: mp.Queue, result_queue: mp.Queue,
+                      progress_shm_name: Optional[str] = None, asr_slot=None):
+    """
+    常驻工作进程：依次处理管理器放入 task_queue 的任务，收到 None 时退出（管理器在 WORKER_MAX_TASKS 个任务后或任务全部完成时发送）
+    
+    语音识别模型、已读取的 API 设置等进程内状态在同一批视频之间保留，不再每个视频重新加载
+    """
+    # 管理器停止任务时先发 SIGTERM：转成 SystemExit，让 finally 中的清理（如取消远端 Batch API 任务）得以执行
+    signal.signal(signal.SIGTERM, _exit_on_sigterm)
+    while True:
+        task = task_queue.get()
+        if task is None:
+            break
+        process_video_worker(
+            task['video_path'],
+            task['engine'],
+            task['api_settings'],
+            task['cache_dir'],
+            progress_queue,
+            result_queue,
+            task['task_id'],
+            True,  # 字幕烧录交给管理器异步执行
+            progress_shm_name,
+            asr_slot,
+            task['config'],
+            task['openai_concurrency']
+        )
 
 
 class VideoProcessorForMultiprocess:
     """简化的视频处理器，专门用于多进程环境"""
     
     def __init__(self, video_path: str, engine: str, api_settings: Dict[str, Any], 
-                 cache_dir: str, progress_queue: mp.Queue, process_id: int):
+                 cache_dir: str, progress_queue: mp.Queue, process_id: int,
+                 defer_burning: bool = False, progress_slots=None, asr_slot=None):
         self.video_path = video_path
         self.engine = engine
         self.api_settings = api_settings
         self.cache_dir = cache_dir
         self.progress_queue = progress_queue
         self.process_id = process_id
+        self.defer_burning = defer_burning
+        self.progress_slots = progress_slots  # 进度共享内存缓冲区，由管理器直接读取
+        self.asr_slot = asr_slot  # 跨进程的语音识别并发限制
         self.base_name = os.path.basename(video_path)
+        self._last_progress = None  # 上次放入进度队列的进度，相同的进度不重复发送
         
         # 创建日志器实例
         self.logger = VideoLogger(cache_dir)
         
-        # 创建独立的requests会话
-        self.session = requests.Session()
-        self.session.headers.update({
-            "Authorization": f"Bearer {self.api_settings.get('api_key', '')}",
-            "Content-Type": "application/json"
-        })
-        
-        # 配置连接池
-        adapter = requests.adapters.HTTPAdapter(
-            pool_connections=5,
-            pool_maxsize=10,
-            max_retries=3,
-            pool_block=False
-        )
-        self.session.mount('http://', adapter)
-        self.session.mount('https://', adapter)
+        # 工作进程会处理多个视频：使用进程内共享的HTTP会话，连接跨视频复用（优先 HTTP/2），
+        # 连接池远大于自适应并发上限 OPENAI_MAX_BATCH_CONCURRENCY；首次创建时在后台预热连接
+        warm_url = self.api_settings.get('base_url') if self.engine == "OpenAI Translate" else None
+        self.session = get_shared_openai_session(self.api_settings.get('api_key', ''), warm_url)
         
         # 继承原有的系统检测逻辑
         self.use_hardware_accel = VideoProcessor._check_hardware_acceleration(self)
@@ -1218,6 +2090,15 @@ class VideoProcessorForMultiprocess:
     
     def report_progress(self, progress: int):
         """报告进度"""
+        if self.progress_slots is not None:
+            write_progress_slot(self.progress_slots, self.process_id, progress, int(time.time() - self.start_time))
+            return
+        
+        # 进度没有变化时不再放入队列
+        if progress == self._last_progress:
+            return
+        self._last_progress = progress
+        
         try:
             elapsed = time.time() - self.start_time
             elapsed_str = self._format_elapsed_time(elapsed)
@@ -1268,7 +2149,7 @@ class VideoProcessorForMultiprocess:
             
             # 语音识别 (10-70%)
             self.report_status("Recognizing speech...")
-            self.generate_subtitles(cache_paths['audio'], cache_paths['srt'])
+            srt_content = self.generate_subtitles(cache_paths['audio'], cache_paths['srt'])
             self.report_progress(70)
             
             # 检查是否需要跳过翻译
@@ -1288,9 +2169,7 @@ class VideoProcessorForMultiprocess:
             
             # 字幕翻译 (70-80%)
             self.report_status("Translating subtitles...")
-            with open(cache_paths['srt'], "r", encoding="utf-8") as f:
-                lines = f.readlines()
-            translated_content = self.translate_subtitles(lines)
+            translated_content = self.translate_subtitles(srt_content)
             
             if not translated_content or translated_content.strip() == "":
                 self.report_status("Empty bilingual subtitles, skipping video synthesis")
@@ -1315,6 +2194,17 @@ class VideoProcessorForMultiprocess:
                 }
             
             # 视频合成 (80-100%)
+            if self.defer_burning:
+                # 交给管理器的异步 ffmpeg 调度执行，当前工作进程立即释放槽位
+                self.report_status("Waiting for video synthesis...")
+                return {
+                    'status': 'burn_pending',
+                    'subtitle_path': cache_paths['bilingual_srt'],
+                    'output_path': cache_paths['output_video'],
+                    'cache_paths': cache_paths,
+                    'skipped_burning': False
+                }
+            
             self.report_status("Synthesizing video...")
             self.burn_subtitles(cache_paths['bilingual_srt'], cache_paths['output_video'])
             self.report_progress(100)
@@ -1332,11 +2222,8 @@ class VideoProcessorForMultiprocess:
             self.report_status(error_msg)
             raise RuntimeError(error_msg)
         finally:
-            # 清理资源
+            # 清理资源（共享的HTTP会话留给同一工作进程的下一个视频）
             try:
-                if hasattr(self, 'session'):
-                    self.session.close()
-                    
                 # 清理日志处理器
                 if hasattr(self, 'logger'):
                     self.logger.cleanup()
@@ -1357,11 +2244,9 @@ class VideoProcessorForMultiprocess:
         return VideoProcessor.extract_audio(self, audio_path)
     
     def generate_subtitles(self, audio_path, srt_path):
-        """生成字幕 - 在子进程中创建独立的语音识别器"""
+        """生成字幕 - 在子进程中创建独立的语音识别器，写入 srt_path 并返回 SRT 内容"""
         try:
-            # 在子进程中导入和初始化语音识别器
-            from core.speech_recognizer import SpeechRecognizer, SubtitleFormatter
-            
+            # 在子进程中初始化语音识别器（模块已在顶层导入，forkserver 预加载时即已载入）
             print(f"🎙️ Process {self.process_id}: Initializing speech recognizer...")
             
             # 创建进程专用的语音识别器
@@ -1379,7 +2264,7 @@ class VideoProcessorForMultiprocess:
                 print(f"🎙️ Process {self.process_id}: Audio file is very small, creating empty subtitle")
                 with open(srt_path, "w", encoding="utf-8") as f:
                     f.write("")
-                return
+                return ""
             
             # 进度回调函数
             def progress_callback(current_chunk, total_chunks):
@@ -1388,13 +2273,21 @@ class VideoProcessorForMultiprocess:
                     progress = 20 + recognition_progress
                     self.report_progress(min(70, int(progress)))
             
-            # 转录
-            result = speech_recognizer.transcribe(
-                audio_path,
-                chunk_duration=120.0,
-                overlap_duration=15.0,
-                progress_callback=progress_callback
-            )
+            # 转录：其他工作进程占用语音识别名额时在此等待，提取音频和翻译等阶段不受影响
+            if self.asr_slot is not None and not self.asr_slot.acquire(block=False):
+                self.report_status("Waiting for speech recognition...")
+                self.asr_slot.acquire()
+                self.report_status("Recognizing speech...")
+            try:
+                result = speech_recognizer.transcribe(
+                    audio_path,
+                    chunk_duration=120.0,
+                    overlap_duration=15.0,
+                    progress_callback=progress_callback
+                )
+            finally:
+                if self.asr_slot is not None:
+                    self.asr_slot.release()
             
             self.report_progress(70)
             
@@ -1406,57 +2299,21 @@ class VideoProcessorForMultiprocess:
             
             segment_count = len(result.sentences)
             print(f"🎙️ Process {self.process_id}: Transcription completed, {segment_count} segments")
+            return srt_content
             
         except Exception as e:
             print(f"🎙️ Process {self.process_id}: Transcription failed: {str(e)}")
             raise RuntimeError(f"Transcription failed: {str(e)}")
     
-    def translate_subtitles(self, lines):
+    def translate_subtitles(self, content):
         """翻译字幕 - 多进程版本，不使用signals"""
         try:
             # 检查是否为空字幕文件
-            if not lines or all(not line.strip() for line in lines):
+            if not content or not content.strip():
                 print(f"🎙️ Process {self.process_id}: Empty subtitle file detected, skipping translation")
                 return ""
             
-            entries = []
-            current_id = None
-            current_timestamp = ""
-            current_text = []
-            parsing_state = "id"  # 可能的状态: id, timestamp, text
-
-            for line in lines:
-                line = line.strip()
-                if not line:  # 空行表示一个字幕条目结束
-                    if current_id is not None and current_timestamp and current_text:
-                        entries.append({
-                            'id': current_id,
-                            'timestamp': current_timestamp,
-                            'text': '\n'.join(current_text)
-                        })
-                    # 重置状态为解析新条目的ID
-                    current_id = None
-                    current_timestamp = ""
-                    current_text = []
-                    parsing_state = "id"
-                    continue
-                
-                if parsing_state == "id" and line.isdigit():
-                    current_id = int(line)
-                    parsing_state = "timestamp"
-                elif parsing_state == "timestamp" and '-->' in line:
-                    current_timestamp = line
-                    parsing_state = "text"
-                elif parsing_state == "text":
-                    current_text.append(line)
-
-            # 处理文件末尾可能存在的最后一个条目
-            if current_id is not None and current_timestamp and current_text:
-                entries.append({
-                    'id': current_id,
-                    'timestamp': current_timestamp,
-                    'text': '\n'.join(current_text)
-                })
+            entries = parse_srt_entries(content)
 
             total_entries = len(entries)
             if total_entries == 0:
@@ -1468,23 +2325,24 @@ class VideoProcessorForMultiprocess:
             # 批量翻译所有字幕 (70% -> 80%)
             self.report_progress(72)
             
-            # 使用自己的翻译方法而不是父类的
+            # 使用自己的翻译方法而不是父类的，已缓存的译文直接复用
             if self.engine == "OpenAI Translate":
-                translated_entries = self._batch_translate_with_openai_multiprocess(entries)
+                translate_func = self._batch_translate_with_openai_multiprocess
             else:  # Google Translation
-                translated_entries = self._batch_translate_with_google_multiprocess(entries)
+                translate_func = self._batch_translate_with_google
+            namespace = translation_cache_namespace(self.engine, self.api_settings)
+            translated_entries = translate_with_cache(self.cache_dir, namespace, entries, translate_func)
             
             self.report_progress(80)
 
             # Sort by ID to Ensure Correct Subtitle Ordering
-            translated_entries.sort(key=lambda x: x['id'])
+            translated_entries.sort(key=operator.itemgetter('id'))  # 输入已按顺序时为 O(n)
 
             # Construct Final Subtitle Content
-            translated_content = ""
-            for entry in translated_entries:
-                translated_content += f"{entry['id']}\n{entry['timestamp']}\n{entry['text']}\n\n"
-
-            return translated_content
+            # 一次性拼接，避免逐条 += 反复重建字符串
+            return "".join(
+                f"{entry['id']}\n{entry['timestamp']}\n{entry['text']}\n\n" for entry in translated_entries
+            )
 
         except Exception as e:
             error_msg = f"Translation Process Failed: {str(e)}"
@@ -1493,25 +2351,6 @@ class VideoProcessorForMultiprocess:
     
     def _batch_translate_with_openai_multiprocess(self, entries):
         """多进程版本的OpenAI翻译"""
-        try:
-            from config import OPENAI_MODEL, OPENAI_CUSTOM_PROMPT, OPENAI_MAX_CHARS_PER_BATCH, OPENAI_MAX_ENTRIES_PER_BATCH
-        except ImportError:
-            # 如果导入失败，使用默认值
-            OPENAI_MAX_CHARS_PER_BATCH = 3600
-            OPENAI_MAX_ENTRIES_PER_BATCH = 100
-            OPENAI_MODEL = "gpt-4.1-nano"
-            OPENAI_CUSTOM_PROMPT = """You are a professional Chinese native translator who needs to fluently translate text into Chinese.
-
-## Translation Rules
-1. Output only the translated content, without explanations or additional content (such as "Here's the translation:" or "Translation as follows:")
-2. The returned translation must maintain exactly the same number of paragraphs and format as the original text
-3. For content that should not be translated (such as proper nouns, code, etc.), keep the original text.
-4. If input contains %%, use %% in your output, if input has no %%, don't use %% in your output
-
-## OUTPUT FORMAT:
-- **Single paragraph input** → Output translation directly (no separators, no extra text)
-- **Multi-paragraph input** → Use %% as paragraph separator between translations"""
-        
         try:
             # 从配置文件获取批处理参数
             max_chars_per_batch = self.api_settings.get("max_chars_per_batch", OPENAI_MAX_CHARS_PER_BATCH)
@@ -1537,9 +2376,10 @@ class VideoProcessorForMultiprocess:
         @exponential_backoff_retry
         def _make_api_request():
             """实际的API请求函数，支持重试"""
-            response = self.session.post(
+            response = post_json(
+                self.session,
                 f"{self.api_settings['base_url']}/v1/chat/completions",
-                json=data,
+                data,
                 timeout=300
             )
             
@@ -1552,52 +2392,17 @@ class VideoProcessorForMultiprocess:
                         raise ContentFilteredException(f"Content filtered by OpenAI: {error_text}")
                     else:
                         raise Exception(f"OpenAI API error: {response.status_code} - {error_text}")
-                elif response.status_code in {429, 500, 502, 503, 504}:
-                    # 这些状态码可以重试
-                    raise RetryableAPIException(f"OpenAI API error: {response.status_code} - {error_text}")
+                elif response.status_code in RETRYABLE_STATUS_CODES:
+                    # 这些状态码可以重试，按服务端的 Retry-After 等待
+                    raise RetryableAPIException(f"OpenAI API error: {response.status_code} - {error_text}",
+                                                retry_after=parse_retry_after(response.headers.get('Retry-After')))
                 else:
                     raise Exception(f"OpenAI API error: {response.status_code} - {error_text}")
             
-            return response.json()
+            return parse_json_response(response)
         
-        try:
-            from config import OPENAI_MODEL, OPENAI_CUSTOM_PROMPT
-        except ImportError:
-            OPENAI_MODEL = "gpt-4.1-nano"
-            OPENAI_CUSTOM_PROMPT = """You are a professional Chinese native translator who needs to fluently translate text into Chinese.
-
-## Translation Rules
-1. Output only the translated content, without explanations or additional content (such as "Here's the translation:" or "Translation as follows:")
-2. The returned translation must maintain exactly the same number of paragraphs and format as the original text
-3. For content that should not be translated (such as proper nouns, code, etc.), keep the original text.
-4. If input contains %%, use %% in your output, if input has no %%, don't use %% in your output
-
-## OUTPUT FORMAT:
-- **Single paragraph input** → Output translation directly (no separators, no extra text)
-- **Multi-paragraph input** → Use %% as paragraph separator between translations"""
-        
-        # 构建翻译文本 - 使用 %% 分隔符
-        if len(entries) == 1:
-            # 单段落，直接翻译
-            text_to_translate = entries[0]['text']
-        else:
-            # 多段落，使用 %% 分隔
-            texts = [entry['text'] for entry in entries]
-            text_to_translate = '\n%%\n'.join(texts)
-        
-        # 使用配置文件中的自定义prompt
-        system_prompt = OPENAI_CUSTOM_PROMPT
-        user_prompt = f"Translate to Chinese (output translation only):\n\n{text_to_translate}"
-        
-        data = {
-            "model": self.api_settings.get("model", OPENAI_MODEL),
-            "messages": [
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
-            "temperature": 0,
-            "max_tokens": 8000  # 适中的token限制
-        }
+        # 构建请求体 - 单段落直接翻译，多段落使用 JSON 数组
+        data = build_openai_chat_payload(self.api_settings.get("model", OPENAI_MODEL), [entry['text'] for entry in entries])
 
         try:
             # 使用重试机制进行API请求
@@ -1621,36 +2426,18 @@ class VideoProcessorForMultiprocess:
                 # 单段落
                 translated_texts = [translated_content]
             else:
-                # 多段落，按 %% 分割
-                if '\n%%\n' in translated_content:
-                    translated_texts = translated_content.split('\n%%\n')
-                elif '%%' in translated_content:
-                    translated_texts = translated_content.split('%%')
-                else:
-                    # 如果没有找到分隔符，可能是单个翻译结果，按行数分割
-                    lines = translated_content.split('\n')
-                    if len(lines) >= len(entries):
-                        translated_texts = lines[:len(entries)]
-                    else:
-                        translated_texts = [translated_content]  # 使用整个翻译作为第一个结果
-            
-            # 确保翻译结果数量匹配
-            while len(translated_texts) < len(entries):
-                translated_texts.append(entries[len(translated_texts)]['text'])  # 使用原文填充
-            translated_texts = translated_texts[:len(entries)]  # 截断多余的结果
-            
-            # 构建最终结果
-            translated_entries = []
-            for i, entry in enumerate(entries):
-                translated_text = translated_texts[i].strip() if i < len(translated_texts) else entry['text']
-                if not translated_text:
-                    translated_text = entry['text']  # 如果翻译为空，使用原文
-                
-                translated_entries.append({
-                    'id': entry['id'],
-                    'timestamp': entry['timestamp'],
-                    'text': f"{entry['text']}\n{translated_text}"
-                })
+                # 多段落，解析 JSON 数组；条数不一致时拆成小批次重试，避免译文错位又不必逐条请求
+                translated_texts = parse_openai_json_translations(translated_content, len(entries))
+                if translated_texts is None:
+                    sub_batches = split_fallback_batches(entries)
+                    print(f"⚠️ Process {self.process_id}: JSON translation result malformed or count mismatch, retrying in {len(sub_batches)} smaller batches")
+                    translated_entries = []
+                    for sub_batch in sub_batches:
+                        translated_entries.extend(self._translate_openai_batch_multiprocess(sub_batch))
+                    return translated_entries
+            
+            # 构建最终结果（如果翻译为空，使用原文）
+            translated_entries = pair_bilingual_entries(entries, translated_texts)
             
             print(f"✅ Process {self.process_id}: Successfully translated {len(translated_entries)} entries via OpenAI")
             return translated_entries
@@ -1658,17 +2445,11 @@ class VideoProcessorForMultiprocess:
         except ContentFilteredException as e:
             print(f"🚫 Process {self.process_id}: Content filtered by OpenAI safety system: {str(e)}")
             # 检查是否启用 Google 降级
-            try:
-                from config import ENABLE_GOOGLE_FALLBACK
-                google_fallback_enabled = ENABLE_GOOGLE_FALLBACK
-            except ImportError:
-                google_fallback_enabled = True  # 默认启用
-            
-            if google_fallback_enabled:
+            if ENABLE_GOOGLE_FALLBACK:
                 # 对于内容过滤，尝试使用 Google Translate 作为降级方案
                 print(f"🔄 Process {self.process_id}: Falling back to Google Translate for filtered content...")
                 try:
-                    return self._translate_google_batch_multiprocess(entries, "\n🔸🔸🔸\n")
+                    return self._translate_google_batch(entries)
                 except Exception as google_error:
                     print(f"❌ Process {self.process_id}: Google Translate fallback also failed: {str(google_error)}")
                     # 如果 Google 翻译也失败，返回原文但标记为已处理
@@ -1694,17 +2475,11 @@ class VideoProcessorForMultiprocess:
         except Exception as e:
             print(f"❌ Process {self.process_id}: OpenAI translation failed after retries: {str(e)}")
             # 检查是否启用 Google 降级
-            try:
-                from config import ENABLE_GOOGLE_FALLBACK
-                google_fallback_enabled = ENABLE_GOOGLE_FALLBACK
-            except ImportError:
-                google_fallback_enabled = True  # 默认启用
-            
-            if google_fallback_enabled:
+            if ENABLE_GOOGLE_FALLBACK:
                 # 对于其他错误，尝试使用 Google Translate 作为降级方案
                 print(f"🔄 Process {self.process_id}: Falling back to Google Translate after OpenAI failure...")
                 try:
-                    return self._translate_google_batch_multiprocess(entries, "\n🔸🔸🔸\n")
+                    return self._translate_google_batch(entries)
                 except Exception as google_error:
                     print(f"❌ Process {self.process_id}: Google Translate fallback also failed: {str(google_error)}")
                     # 如果 Google 翻译也失败，返回原文
@@ -1754,179 +2529,47 @@ class VideoProcessorForMultiprocess:
         
         print(f"🎙️ Process {self.process_id}: Split into {len(batches)} batches for OpenAI translation")
         
-        # 逐批次翻译
-        for i, batch in enumerate(batches):
-            try:
-                print(f"🎙️ Process {self.process_id}: Translating batch {i+1}/{len(batches)} with {len(batch)} entries")
-                
-                # 使用单批次翻译函数
-                translated_batch = self._translate_openai_batch_multiprocess(batch)
-                all_translated.extend(translated_batch)
-                
-                # 发出进度信号
-                progress = 72 + int((i + 1) / len(batches) * 8)
-                self.report_progress(min(80, progress))
-                
-                # 批次间适当延迟，避免API限制
-                if i < len(batches) - 1:
-                    time.sleep(0.1)
-                    
-            except Exception as e:
-                print(f"❌ Process {self.process_id}: Failed to translate batch {i+1}: {str(e)}")
-                # 如果批次翻译失败，保留原文
-                failed_batch = []
-                for entry in batch:
-                    failed_batch.append({
-                        'id': entry['id'],
-                        'timestamp': entry['timestamp'],
-                        'text': entry['text']  # 保持原文
-                    })
-                all_translated.extend(failed_batch)
+        # 条目很多且启用了 Batch API 时先整体提交，未成功的批次再走常规并发请求
+        translated_batches = [None] * len(batches)
+        if OPENAI_USE_BATCH_API and len(entries) >= OPENAI_BATCH_API_MIN_ENTRIES:
+            translated_batches = self._translate_openai_via_batch_api(batches)
+        
+        # 并发翻译各批次，按批次顺序合并结果
+        pending = [i for i, translated_batch in enumerate(translated_batches) if translated_batch is None]
+        if pending:
+            results = asyncio.run(self._translate_openai_batches_concurrently([batches[i] for i in pending]))
+            for i, translated_batch in zip(pending, results):
+                translated_batches[i] = translated_batch
+        for translated_batch in translated_batches:
+            all_translated.extend(translated_batch)
         
         print(f"🎙️ Process {self.process_id}: Completed OpenAI translation: {len(all_translated)} entries")
         return all_translated
     
-    def _batch_translate_with_google_multiprocess(self, entries):
-        """多进程版本的Google翻译"""
-        try:
-            # 使用不会被翻译的特殊Unicode分隔符
-            separator = "\n🔸🔸🔸\n"  # 使用特殊符号，Google Translate不会翻译
-            max_chars = OPENAI_MAX_CHARS_PER_BATCH # 留一些余量，避免超过5000字符限制
-            translated_entries = []
-            
-            # 分批处理字幕条目
-            current_batch = []
-            current_length = 0
-            batch_count = 0
-            
-            # 先计算总批次数以便显示进度
-            total_batches = 1
-            temp_length = 0
-            for entry in entries:
-                entry_length = len(entry['text']) + len(separator)
-                if temp_length + entry_length > max_chars and temp_length > 0:
-                    total_batches += 1
-                    temp_length = entry_length
-                else:
-                    temp_length += entry_length
-            
-            for entry in entries:
-                entry_text = entry['text']
-                entry_length = len(entry_text) + len(separator)
-                
-                # 如果添加当前条目会超过限制，先处理当前批次
-                if current_length + entry_length > max_chars and current_batch:
-                    batch_count += 1
-                    print(f"🎙️ Process {self.process_id}: Processing Google Translate batch {batch_count}/{total_batches} ({len(current_batch)} entries, {current_length} chars)")
-                    
-                    # 更新进度 (72% -> 80% 的范围内)
-                    progress = 72 + int((batch_count / total_batches) * 8)
-                    self.report_progress(min(80, progress))
-                    
-                    batch_results = self._translate_google_batch_multiprocess(current_batch, separator)
-                    translated_entries.extend(batch_results)
-                    
-                    # 重置批次
-                    current_batch = []
-                    current_length = 0
-                
-                current_batch.append(entry)
-                current_length += entry_length
-            
-            # 处理最后一批
-            if current_batch:
-                batch_count += 1
-                print(f"🎙️ Process {self.process_id}: Processing final Google Translate batch {batch_count}/{total_batches} ({len(current_batch)} entries, {current_length} chars)")
-                batch_results = self._translate_google_batch_multiprocess(current_batch, separator)
-                translated_entries.extend(batch_results)
-            
-            print(f"🎙️ Process {self.process_id}: Successfully translated {len(translated_entries)} entries via Google Translate in {batch_count} batches")
-            return translated_entries
-            
-        except Exception as e:
-            print(f"❌ Process {self.process_id}: Google Translate batch translation failed: {str(e)}")
-            raise
+    def _translate_openai_batch(self, entries):
+        return self._translate_openai_batch_multiprocess(entries)
     
-    def _translate_google_batch_multiprocess(self, entries, separator):
-        """多进程版本的Google批次翻译 - 改进的分隔符处理"""
-        # 提取所有需要翻译的文本
-        texts_to_translate = [entry['text'] for entry in entries]
-        
-        # 使用分隔符将所有文本合并成一个大字符串
-        combined_text = separator.join(texts_to_translate)
-        
-        # 使用Deep Translator进行批量翻译
-        from deep_translator import GoogleTranslator
-        translator = GoogleTranslator(source='auto', target='zh-CN')
-        translated_combined = translator.translate(combined_text)
-        
-        if not translated_combined:
-            raise ValueError("Empty response from Google Translate")
-        
-        # 尝试按分隔符分割翻译结果
-        translated_texts = translated_combined.split(separator)
-        
-        # 如果分隔符被破坏，尝试智能恢复
-        if len(translated_texts) != len(entries):
-            print(f"⚠️ Process {self.process_id}: Translation count mismatch: expected {len(entries)}, got {len(translated_texts)}")
-            
-            # 尝试其他可能的分隔符变体
-            alternate_separators = [
-                "\n🔸🔸🔸\n",
-                "🔸🔸🔸",
-                "\n🔸🔸\n", 
-                "🔸🔸",
-                "\n"
-            ]
-            
-            for alt_sep in alternate_separators:
-                alt_split = translated_combined.split(alt_sep)
-                if len(alt_split) == len(entries):
-                    print(f"✅ Process {self.process_id}: Successfully recovered using alternate separator: '{alt_sep}'")
-                    translated_texts = alt_split
-                    break
-            
-            # 如果还是不匹配，尝试按行数分割
-            if len(translated_texts) != len(entries):
-                lines = translated_combined.split('\n')
-                if len(lines) >= len(entries):
-                    # 尝试均匀分配行
-                    lines_per_entry = len(lines) // len(entries)
-                    translated_texts = []
-                    for i in range(len(entries)):
-                        start_idx = i * lines_per_entry
-                        end_idx = start_idx + lines_per_entry if i < len(entries) - 1 else len(lines)
-                        entry_text = '\n'.join(lines[start_idx:end_idx]).strip()
-                        translated_texts.append(entry_text)
-                    print(f"✅ Process {self.process_id}: Recovered by splitting {len(lines)} lines into {len(entries)} entries")
-            
-            # 最后的保险措施：填充或截断
-            if len(translated_texts) < len(entries):
-                # 如果翻译结果太少，用原文填充
-                while len(translated_texts) < len(entries):
-                    missing_idx = len(translated_texts)
-                    translated_texts.append(entries[missing_idx]['text'])
-                print(f"⚠️ Process {self.process_id}: Padded missing translations with original text")
-            elif len(translated_texts) > len(entries):
-                # 如果翻译结果太多，截断多余部分
-                translated_texts = translated_texts[:len(entries)]
-                print(f"⚠️ Process {self.process_id}: Truncated excess translations")
-        
-        # 构建翻译结果
-        batch_results = []
-        for i, entry in enumerate(entries):
-            translated_text = translated_texts[i].strip() if i < len(translated_texts) else ""
-            if not translated_text:
-                translated_text = entry['text']  # 如果翻译失败，使用原文
-            
-            batch_results.append({
-                'id': entry['id'],
-                'timestamp': entry['timestamp'],
-                'text': f"{entry['text']}\n{translated_text}"
-            })
-        
-        return batch_results
+    def _translate_openai_via_batch_api(self, batches):
+        return VideoProcessor._translate_openai_via_batch_api(self, batches)
+    
+    def _translate_openai_batches_concurrently(self, batches):
+        return VideoProcessor._translate_openai_batches_concurrently(self, batches)
+    
+    def _batch_translate_with_google(self, entries):
+        return VideoProcessor._batch_translate_with_google(self, entries)
+    
+    def _translate_google_batches_concurrently(self, batches):
+        return VideoProcessor._translate_google_batches_concurrently(self, batches)
+    
+    def _translate_google_batch(self, entries):
+        return VideoProcessor._translate_google_batch(self, entries)
     
+    def _translate_google_individually(self, entries, unique_texts):
+        return VideoProcessor._translate_google_individually(self, entries, unique_texts)
+    
+    def _merge_google_batch(self, entries, unique_texts, translated_combined):
+        return VideoProcessor._merge_google_batch(self, entries, unique_texts, translated_combined)
+
     def burn_subtitles(self, subtitle_path, output_path):
         return VideoProcessor.burn_subtitles(self, subtitle_path, output_path)
 
@@ -1935,44 +2578,54 @@ class MultiprocessVideoManager:
     """多进程视频处理管理器"""
     
     def __init__(self, max_processes: Optional[int] = None):
-        # 防止在 macOS .app 打包环境中出现分叉炸弹
-        try:
-            # 确保多进程启动方法设置正确
-            if hasattr(mp, 'get_start_method'):
-                current_method = mp.get_start_method(allow_none=True)
-                if current_method != 'spawn':
-                    mp.set_start_method('spawn', force=True)
-        except RuntimeError:
-            # 启动方法已经设置，忽略错误
-            pass
+        # 使用显式的启动上下文，不依赖（也不修改）全局启动方法，防止在 macOS .app 打包环境中出现分叉炸弹
+        self.ctx = MP_CONTEXT
             
-        self.processes = []
+        self.processes = {}  # 已启动的全部任务 {process_id: process_info}，按任务ID直接查找
         self.active_processes = {}  # 跟踪活动进程 {process_id: process_info}
         self.pending_tasks = []  # 等待处理的任务队列
-        self.progress_queue = mp.Queue()
-        self.result_queue = mp.Queue()
+        self.workers = {}  # 常驻工作进程 {worker_id: {'process', 'task_queue', 'asr_slot', 'task_id', 'tasks_done', 'retiring'}}
+        self.next_worker_id = 0
+        self._lost_results = []  # 工作进程意外退出时为其正在处理的任务生成的错误结果
+        self._asr_semaphore = self.ctx.Semaphore(MAX_ASR_JOBS)  # 所有工作进程共享的语音识别名额
+        self._openai_concurrency = {}  # 工作进程学到的 OpenAI 自适应并发状态，交给下一个任务继续使用
+        self.progress_queue = self.ctx.Queue()
+        self.result_queue = self.ctx.Queue()
         self.is_processing = False
         self.next_process_id = 0
         
+        # 读取当前设置（模块顶部导入的值不会随设置对话框保存而更新）
+        settings = config_snapshot()
+        
         # 使用配置文件中的进程数，或者传入的参数
         if max_processes is not None:
             self.max_processes = max_processes
         else:
             # 从config导入进程数配置
-            self.max_processes = MAX_PROCESSES
-        
-        print(f"🔧 MultiprocessVideoManager initialized with max_processes={self.max_processes}")
+            self.max_processes = settings['MAX_PROCESSES']
+        
+        # 字幕烧录由管理器在独立线程的事件循环中并发执行，不占用工作进程槽位
+        self.max_ffmpeg_jobs = max(1, settings['MAX_FFMPEG_JOBS'])
+        self._burn_loop = None
+        self._burn_thread = None
+        self._burn_semaphore = None
+        self._burn_futures = set()  # 尚未完成的烧录任务
+        self._burn_processes = set()  # 正在运行的 ffmpeg 子进程（仅在事件循环线程中访问）
+        self._burn_updates = queue.Queue()  # 烧录阶段的进度/状态更新
+        self._burn_results = queue.Queue()  # 烧录完成后的最终结果
+        
+        # 进度槽共享内存，工作进程直接写入，get_progress_updates 读取
+        self._progress_shm = shared_memory.SharedMemory(create=True, size=PROGRESS_SLOT_SIZE * PROGRESS_SLOT_COUNT)
+        self._progress_shm.buf[:] = bytes(self._progress_shm.size)
+        
+        # API 设置放在共享内存中，工作进程只接收 (名称, 长度)，不再为每个任务序列化整个字典
+        self._api_settings_blocks = {}  # {序列化后的设置: SharedMemory}
+        
+        print(f"🔧 MultiprocessVideoManager initialized with max_processes={self.max_processes}, max_ffmpeg_jobs={self.max_ffmpeg_jobs}")
     
     def _is_apple_silicon(self) -> bool:
-        """检测是否是Apple Silicon"""
-        if platform.system() != 'Darwin':
-            return False
-        try:
-            result = subprocess.run(['sysctl', '-n', 'hw.optional.arm64'], 
-                                  capture_output=True, text=True, timeout=5)
-            return result.returncode == 0 and result.stdout.strip() == '1'
-        except Exception:
-            return False
+        """检测是否是Apple Silicon（结果在进程内缓存）"""
+        return detect_apple_silicon()
     
     def start_processing(self, video_tasks: list):
         """
@@ -1985,7 +2638,7 @@ class MultiprocessVideoManager:
             raise RuntimeError("已有处理任务在进行中")
         
         self.is_processing = True
-        self.processes = []
+        self.processes = {}
     
     def submit_video(self, video_path: str, engine: str, api_settings: Dict[str, Any], cache_dir: str) -> int:
         """
@@ -2008,7 +2661,8 @@ class MultiprocessVideoManager:
             'task_id': self.next_process_id,
             'video_path': video_path,
             'engine': engine,
-            'api_settings': api_settings,
+            'api_settings': self._share_api_settings(api_settings),
+            'config': config_snapshot(),  # 提交时的设置，工作进程据此覆盖启动时读取的配置
             'cache_dir': cache_dir,
             'status': 'pending'  # pending, running, completed, failed
         }
@@ -2017,108 +2671,335 @@ class MultiprocessVideoManager:
         
         # 将任务添加到待处理队列
         self.pending_tasks.append(task_info)
-        print(f"📝 Added task {task_info['task_id']} for {os.path.basename(video_path)} to queue")
+        mp_logger.debug("Added task %s for %s to queue", task_info['task_id'], os.path.basename(video_path))
         
         # 尝试启动新任务
-        self._try_start_next_tasks()
+        self._pump()
         
         return task_info['task_id']
     
-    def _try_start_next_tasks(self):
-        """尝试启动下一个任务（如果有空闲进程槽位）"""
-        # 清理已完成的进程
-        self._cleanup_finished_processes()
-        
-        # 检查是否有空闲槽位和待处理任务
-        while len(self.active_processes) < self.max_processes and self.pending_tasks:
-            task_info = self.pending_tasks.pop(0)  # 取出第一个任务
-            self._start_task(task_info)
+    def _share_api_settings(self, api_settings: Dict[str, Any]) -> Tuple[str, int]:
+        """把 API 设置写入共享内存（相同的设置只写一次），返回供工作进程读取的 (名称, 长度)"""
+        payload = pickle.dumps(api_settings, protocol=pickle.HIGHEST_PROTOCOL)
+        shm = self._api_settings_blocks.get(payload)
+        if shm is None:
+            shm = shared_memory.SharedMemory(create=True, size=len(payload))
+            shm.buf[:len(payload)] = payload
+            self._api_settings_blocks[payload] = shm
+        return shm.name, len(payload)
     
-    def _start_task(self, task_info: Dict[str, Any]):
-        """启动单个任务"""
-        process_id = task_info['task_id']
-        
-        # 创建并启动进程
-        process = mp.Process(
-            target=process_video_worker,
+    def _pump(self):
+        """一次遍历回收已退出的工作进程，把待处理任务分配给空闲的工作进程，处理满 WORKER_MAX_TASKS 个任务或全部完成后让工作进程退出"""
+        for worker_id, worker in list(self.workers.items()):
+            process = worker['process']
+            if process.is_alive():
+                continue
+            process.join(timeout=1)
+            exitcode = process.exitcode
+            if exitcode is not None:
+                process.close()
+            worker['task_queue'].close()
+            # 进程在语音识别途中被杀死时来不及归还名额，由管理器代为归还，否则其他工作进程会一直等待
+            if worker['asr_slot'].held.value:
+                worker['asr_slot'].release()
+            del self.workers[worker_id]
+            # 工作进程在处理任务时退出（崩溃或被系统杀死），该任务不会再有结果，直接报告失败
+            task_info = self.active_processes.pop(worker['task_id'], None)
+            if task_info is not None:
+                task_info['completed'] = True
+                task_info['status'] = 'failed'
+                self._lost_results.append({
+                    'process_id': task_info['task_id'],
+                    'video_path': task_info['video_path'],
+                    'status': 'error',
+                    'error': f"Worker process exited unexpectedly (exit code {exitcode})"
+                })
+            mp_logger.debug("Cleaned up exited worker %s", worker_id)
+        
+        # 处理满 WORKER_MAX_TASKS 个任务的空闲工作进程退出，退出后其槽位由新启动的进程接替
+        for worker in self.workers.values():
+            if worker['task_id'] is None and not worker['retiring'] and worker['tasks_done'] >= WORKER_MAX_TASKS:
+                self._retire_worker(worker)
+        
+        # 把待处理任务交给空闲的工作进程，不够时启动新的工作进程（不超过 max_processes，正在退出的进程也占槽位）
+        while self.pending_tasks:
+            worker = next((w for w in self.workers.values() if w['task_id'] is None and not w['retiring']), None)
+            if worker is None:
+                if len(self.workers) >= self.max_processes:
+                    break
+                worker = self._start_worker()
+            self._start_task(self.pending_tasks.pop(0), worker)
+        
+        # 没有任务时让工作进程退出，释放常驻的模型内存
+        if not self.pending_tasks and not self.active_processes:
+            for worker in self.workers.values():
+                if not worker['retiring']:
+                    self._retire_worker(worker)
+    
+    def _retire_worker(self, worker: Dict[str, Any]):
+        """让空闲的工作进程处理完队列后退出，之后由 _pump 回收"""
+        worker['retiring'] = True
+        worker['task_queue'].put(None)
+    
+    def _start_worker(self) -> Dict[str, Any]:
+        """启动一个常驻工作进程"""
+        worker_id = self.next_worker_id
+        self.next_worker_id += 1
+        task_queue = self.ctx.Queue()
+        asr_slot = AsrSlot(self._asr_semaphore, self.ctx.Value('b', 0, lock=False))
+        process = self.ctx.Process(
+            target=video_worker_loop,
             args=(
-                task_info['video_path'],
-                task_info['engine'],
-                task_info['api_settings'],
-                task_info['cache_dir'],
+                task_queue,
                 self.progress_queue,
                 self.result_queue,
-                process_id
+                self._progress_shm.name if self._progress_shm is not None else None,
+                asr_slot
             )
         )
         process.start()
+        worker = {'process': process, 'task_queue': task_queue, 'asr_slot': asr_slot, 'task_id': None,
+                  'tasks_done': 0, 'retiring': False}
+        self.workers[worker_id] = worker
+        mp_logger.debug("Started worker %s (workers: %d/%d)", worker_id, len(self.workers), self.max_processes)
+        return worker
+    
+    def _start_task(self, task_info: Dict[str, Any], worker: Dict[str, Any]):
+        """把单个任务交给空闲的工作进程"""
+        process_id = task_info['task_id']
+        worker['task_queue'].put({
+            'task_id': process_id,
+            'video_path': task_info['video_path'],
+            'engine': task_info['engine'],
+            'api_settings': task_info['api_settings'],
+            'config': task_info['config'],
+            'openai_concurrency': dict(self._openai_concurrency),
+            'cache_dir': task_info['cache_dir']
+        })
+        worker['task_id'] = process_id
         
         # 更新任务状态
         task_info['status'] = 'running'
-        task_info['process'] = process
         task_info['completed'] = False
+        task_info['start_time'] = time.time()
         
         # 保存进程信息
-        self.processes.append(task_info)
+        self.processes[process_id] = task_info
         self.active_processes[process_id] = task_info
         
-        print(f"🚀 Started process {process_id} for {os.path.basename(task_info['video_path'])} (active: {len(self.active_processes)}/{self.max_processes}, pending: {len(self.pending_tasks)})")
-    
-    def _cleanup_finished_processes(self):
-        """清理已完成的进程并启动新任务"""
-        finished_process_ids = []
-        
-        for process_id, proc_info in self.active_processes.items():
-            if not proc_info['process'].is_alive():
-                finished_process_ids.append(process_id)
-                # 确保进程正确结束
-                proc_info['process'].join(timeout=1)
-                proc_info['completed'] = True
-                proc_info['status'] = 'completed'
-                print(f"🧹 Cleaned up finished process {process_id} for {os.path.basename(proc_info['video_path'])}")
-        
-        # 从活动进程字典中移除已完成的进程
-        for process_id in finished_process_ids:
-            if process_id in self.active_processes:
-                del self.active_processes[process_id]
+        mp_logger.debug("Started task %s for %s (active: %d/%d, pending: %d)", process_id,
+                        os.path.basename(task_info['video_path']), len(self.active_processes),
+                        self.max_processes, len(self.pending_tasks))
     
     def get_progress_updates(self) -> list:
         """获取所有进度更新"""
-        # 首先清理已完成的进程并尝试启动新任务
-        self._cleanup_finished_processes()
-        self._try_start_next_tasks()
+        # 先读取进度槽，再回收已退出的工作进程并尝试分配新任务
+        updates = self._read_progress_slots()
+        self._pump()
         
-        updates = []
         while True:
             try:
                 update = self.progress_queue.get_nowait()
                 updates.append(update)
             except queue.Empty:
                 break
+        while True:
+            try:
+                updates.append(self._burn_updates.get_nowait())
+            except queue.Empty:
+                break
+        return coalesce_progress_updates(updates)
+    
+    def _read_progress_slots(self) -> list:
+        """读取活动任务的进度槽，只为进度发生变化的任务生成进度更新"""
+        updates = []
+        if self._progress_shm is None:
+            return updates
+        
+        buf = self._progress_shm.buf
+        for process_id, task_info in self.active_processes.items():
+            slot = read_progress_slot(buf, process_id)
+            if slot is None or slot == task_info.get('reported_progress'):
+                continue
+            task_info['reported_progress'] = slot
+            progress, elapsed_seconds = slot
+            updates.append({
+                'type': 'progress',
+                'process_id': process_id,
+                'video_path': task_info['video_path'],
+                'base_name': os.path.basename(task_info['video_path']),
+                'progress': progress,
+                'elapsed_time': f"{elapsed_seconds // 60:02d}:{elapsed_seconds % 60:02d}"
+            })
         return updates
     
     def get_results(self) -> list:
         """获取所有完成的结果"""
         results = []
+        finished = False
         while True:
             try:
                 result = self.result_queue.get_nowait()
+            except queue.Empty:
+                break
+            self._openai_concurrency.update(result.pop('openai_concurrency', None) or {})
+            # 工作进程处理完一个任务后即可接收下一个任务
+            task_info = self.active_processes.pop(result['process_id'], None)
+            if task_info is None:
+                continue  # 任务已被停止或已按工作进程退出报告失败
+            finished = True
+            task_info['completed'] = True
+            task_info['status'] = 'completed' if result['status'] == 'success' else 'failed'
+            for worker in self.workers.values():
+                if worker['task_id'] == result['process_id']:
+                    worker['task_id'] = None
+                    worker['tasks_done'] += 1
+            # 等待烧录的任务交给异步 ffmpeg 调度，烧录完成后才返回最终结果
+            if result['status'] == 'success' and result['result'].get('status') == 'burn_pending':
+                self._submit_burn(result)
+            else:
                 results.append(result)
+        if finished:
+            self._pump()
+        results.extend(self._lost_results)
+        self._lost_results.clear()
+        while True:
+            try:
+                results.append(self._burn_results.get_nowait())
             except queue.Empty:
                 break
         return results
     
+    # ===== 异步字幕烧录 =====
+    
+    def _ensure_burn_loop(self):
+        """启动烧录专用的事件循环线程（延迟初始化）"""
+        if self._burn_loop is None:
+            self._burn_loop = asyncio.new_event_loop()
+            self._burn_semaphore = asyncio.Semaphore(self.max_ffmpeg_jobs)
+            self._burn_thread = threading.Thread(target=self._burn_loop.run_forever, daemon=True)
+            self._burn_thread.start()
+    
+    def _submit_burn(self, worker_result: Dict[str, Any]):
+        """把工作进程完成翻译后的烧录任务放到事件循环中执行"""
+        self._ensure_burn_loop()
+        future = asyncio.run_coroutine_threadsafe(self._burn_async(worker_result), self._burn_loop)
+        self._burn_futures.add(future)
+        future.add_done_callback(self._burn_futures.discard)
+    
+    def _put_burn_update(self, worker_result: Dict[str, Any], update: Dict[str, Any]):
+        """记录烧录阶段的进度/状态更新，格式与工作进程的更新一致"""
+        update.update({
+            'process_id': worker_result['process_id'],
+            'video_path': worker_result['video_path'],
+            'base_name': os.path.basename(worker_result['video_path'])
+        })
+        self._burn_updates.put(update)
+    
+    async def _burn_async(self, worker_result: Dict[str, Any]):
+        """在信号量限制下运行 ffmpeg 烧录字幕，并把最终结果放入结果队列"""
+        result = worker_result['result']
+        video_path = worker_result['video_path']
+        subtitle_path = result['subtitle_path']
+        output_path = result['output_path']
+        
+        try:
+            async with self._burn_semaphore:
+                ffmpeg_path = VideoProcessor.get_ffmpeg_path()
+                if not ffmpeg_path:
+                    raise FileNotFoundError("Could not find ffmpeg. Please install it first (e.g., brew install ffmpeg).")
+                
+                self._put_burn_update(worker_result, {'type': 'status', 'status': "Synthesizing video..."})
+                temp_path = temp_output_path(output_path)
+                cmd = VideoProcessor.build_burn_command(ffmpeg_path, video_path, subtitle_path, temp_path)
+                started = []
+                
+                def _on_start(process):
+                    started.append(process)
+                    self._burn_processes.add(process)
+                
+                # 监控进度 (80% -> 99%)，完成后再报告 100%；ffprobe 在线程中运行，不阻塞其他烧录
+                duration = await asyncio.to_thread(probe_media_duration, ffmpeg_path, video_path)
+                task_info = self.processes.get(worker_result['process_id'], {})
+                start_time = task_info.get('start_time', time.time())
+                last_progress = [80]
+                
+                def _on_progress(fraction):
+                    current_progress = min(99, 80 + int(fraction * 20))
+                    if current_progress > last_progress[0]:
+                        last_progress[0] = current_progress
+                        elapsed = time.time() - start_time
+                        self._put_burn_update(worker_result, {
+                            'type': 'progress',
+                            'progress': current_progress,
+                            'elapsed_time': f"{int(elapsed // 60):02d}:{int(elapsed % 60):02d}"
+                        })
+                
+                try:
+                    # stderr 只保留最后几行
+                    return_code, stderr_tail = await run_ffmpeg_with_progress(cmd, duration, _on_progress, _on_start)
+                    
+                    if return_code != 0:
+                        raise RuntimeError(f"Error during FFmpeg processing: {stderr_tail}")
+                    
+                    # 验证输出文件并替换到最终路径
+                    finalize_output_file(temp_path, output_path)
+                finally:
+                    self._burn_processes.difference_update(started)
+                    discard_temp_output(temp_path)
+            
+            elapsed = time.time() - start_time
+            self._put_burn_update(worker_result, {
+                'type': 'progress',
+                'progress': 100,
+                'elapsed_time': f"{int(elapsed // 60):02d}:{int(elapsed % 60):02d}"
+            })
+            self._put_burn_update(worker_result, {'type': 'status', 'status': "Processing completed!"})
+            self._burn_results.put({
+                'process_id': worker_result['process_id'],
+                'video_path': video_path,
+                'status': 'success',
+                'result': {
+                    'status': 'completed',
+                    'output_path': output_path,
+                    'cache_paths': result['cache_paths'],
+                    'skipped_burning': False
+                }
+            })
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            error_msg = f"Processing failed: {str(e)}"
+            self._put_burn_update(worker_result, {'type': 'status', 'status': error_msg})
+            self._burn_results.put({
+                'process_id': worker_result['process_id'],
+                'video_path': video_path,
+                'status': 'error',
+                'error': error_msg
+            })
+    
+    async def _drain_burn_tasks(self):
+        """等待已取消的烧录任务跑完 finally（终止并回收 ffmpeg、删除临时输出文件）"""
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+    
+    def _kill_burn_processes(self):
+        """终止所有正在运行的 ffmpeg 烧录进程（在事件循环线程中执行）"""
+        for process in list(self._burn_processes):
+            if process.returncode is None:
+                process.kill()
+    
     def is_all_complete(self) -> bool:
         """检查所有任务是否完成（包括队列中的）"""
         if not self.processes and not self.pending_tasks:
             return True
         
         # 清理已完成的进程并尝试启动新任务
-        self._cleanup_finished_processes()
-        self._try_start_next_tasks()
+        self._pump()
         
-        # 检查是否还有活动进程或待处理任务
-        return len(self.active_processes) == 0 and len(self.pending_tasks) == 0
+        # 检查是否还有活动进程、待处理任务或正在烧录的任务
+        return len(self.active_processes) == 0 and len(self.pending_tasks) == 0 and not self._burn_futures
     
     def process_videos(self, video_paths: List[str], engine: str, api_settings: Dict[str, Any], cache_dir: str) -> List[int]:
         """
@@ -2152,7 +3033,7 @@ class MultiprocessVideoManager:
     
     def get_active_process_count(self) -> int:
         """获取当前活动进程数量"""
-        self._cleanup_finished_processes()
+        self._pump()
         return len(self.active_processes)
     
     def get_total_process_count(self) -> int:
@@ -2163,16 +3044,32 @@ class MultiprocessVideoManager:
         """停止所有进程"""
         print("🛑 Stopping all processes...")
         
-        # 停止所有活动进程
-        for process_id, proc_info in self.active_processes.items():
-            if proc_info['process'].is_alive():
-                print(f"🛑 Terminating process {process_id}")
-                proc_info['process'].terminate()
-                proc_info['process'].join(timeout=5)
-                if proc_info['process'].is_alive():
-                    print(f"🛑 Force killing process {process_id}")
-                    proc_info['process'].kill()
-                proc_info['completed'] = True
+        # 停止所有工作进程
+        for worker_id, worker in self.workers.items():
+            process = worker['process']
+            if process.is_alive():
+                print(f"🛑 Terminating worker {worker_id}")
+                process.terminate()
+                process.join(timeout=5)
+                if process.is_alive():
+                    print(f"🛑 Force killing worker {worker_id}")
+                    process.kill()
+                    process.join(timeout=1)
+            # 进程已结束，队列中可能残留未取走的任务，不等待其写入线程
+            worker['task_queue'].cancel_join_thread()
+            worker['task_queue'].close()
+        for proc_info in self.active_processes.values():
+            proc_info['completed'] = True
+        self.workers.clear()
+        self._lost_results.clear()
+        # 被强制杀死的进程可能仍占着语音识别名额，之后的新工作进程使用新的信号量
+        self._asr_semaphore = self.ctx.Semaphore(MAX_ASR_JOBS)
+        
+        # 停止正在进行的异步烧录
+        if self._burn_loop is not None:
+            for future in list(self._burn_futures):
+                future.cancel()
+            self._burn_loop.call_soon_threadsafe(self._kill_burn_processes)
         
         # 清空活动进程字典和待处理任务
         self.active_processes.clear()
@@ -2199,6 +3096,31 @@ class MultiprocessVideoManager:
             except queue.Empty:
                 break
         
+        # 释放 API 设置的共享内存
+        for shm in self._api_settings_blocks.values():
+            shm.close()
+            shm.unlink()
+        self._api_settings_blocks.clear()
+        
+        # 释放进度槽共享内存
+        if self._progress_shm is not None:
+            self._progress_shm.close()
+            self._progress_shm.unlink()
+            self._progress_shm = None
+        
+        # 关闭烧录事件循环线程：先等被取消的烧录任务清理完毕，否则停止循环后 finally 不会执行，留下临时文件
+        if self._burn_loop is not None:
+            drain = asyncio.run_coroutine_threadsafe(self._drain_burn_tasks(), self._burn_loop)
+            try:
+                drain.result(timeout=5)
+            except concurrent.futures.TimeoutError:
+                print("⚠️ Timed out waiting for burn tasks to finish cleanup")
+            self._burn_loop.call_soon_threadsafe(self._burn_loop.stop)
+            self._burn_thread.join(timeout=5)
+            self._burn_loop.close()
+            self._burn_loop = None
+            self._burn_thread = None
+        
         print("🧹 Multiprocess manager cleanup completed")
     
     def shutdown(self):
@@ -7,6 +7,10 @@ from config import (OPENAI_CUSTOM_PROMPT, DEFAULT_CUSTOM_PROMPT, DEFAULT_MAX_CHA
 
 
 class ApiSettingsDialog(QDialog):
+    # 每次打开对话框都复用的模型列表和样式表
+    MODELS = ("gpt-4o-mini", "gpt-4.1-mini", "gpt-4.1-nano")
+    _PROMPT_QSS = "QTextEdit { color: white; }"
+
     def __init__(self, parent=None, api_settings=None):
         super().__init__(parent)
         self.api_settings = api_settings or {
@@ -93,16 +97,13 @@ class ApiSettingsDialog(QDialog):
         # Model
         layout.addWidget(self.create_label("Model"))
         self.model_combo = QComboBox(self)
-        models = ["gpt-4o-mini", "gpt-4.1-mini", "gpt-4.1-nano"]
-        self.model_combo.addItems(models)
+        self.model_combo.addItems(self.MODELS)
         self.model_combo.setEditable(True)
 
         current_model = self.api_settings.get("model", OPENAI_MODEL)
-        if current_model in models:
-            self.model_combo.setCurrentText(current_model)
-        else:
+        if self.model_combo.findText(current_model) < 0:
             self.model_combo.addItem(current_model)
-            self.model_combo.setCurrentText(current_model)
+        self.model_combo.setCurrentText(current_model)
 
         # 设置合适的高度
         self.model_combo.setFixedHeight(32)
@@ -188,7 +189,7 @@ class ApiSettingsDialog(QDialog):
         self.prompt_text = QTextEdit(self)
         self.prompt_text.setPlainText(self.api_settings.get("custom_prompt", ""))
         # 确保文本颜色为白色（适配深色主题）
-        self.prompt_text.setStyleSheet("QTextEdit { color: white; }")
+        self.prompt_text.setStyleSheet(self._PROMPT_QSS)
         # self.prompt_text.setFixedHeight(80)  # 减小高度
         layout.addWidget(self.prompt_text)
         
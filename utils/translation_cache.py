@@ -0,0 +1,160 @@
+import collections
+import functools
+import hashlib
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, Optional
+
+
+# 缓存格式版本，修改键的构成或存储内容时递增，旧条目自动失效
+TRANSLATION_CACHE_VERSION = 1
+
+# 默认最多保留的条目数，超过后按最近使用时间淘汰
+DEFAULT_MAX_ENTRIES = 200000
+
+# 进程内内存层最多保留的条目数，热点译文直接命中内存，不再查询 SQLite
+MEMORY_MAX_ENTRIES = 50000
+
+
+class TranslationCache:
+    """基于 SQLite 的持久化翻译缓存（LRU 淘汰），可跨视频、跨运行、跨进程共享
+
+    前面有一层进程内的有界 LRU 内存缓存，所有实例共享，写入时同时写入两层
+    """
+
+    _memory = collections.OrderedDict()
+    _memory_lock = threading.Lock()
+
+    def __init__(self, path: str, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        # WAL 允许多个工作进程同时读写同一个缓存文件
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            # 建表、初始化计数和触发器放在同一个写事务里，避免多个进程同时初始化时计数不一致
+            self._conn.execute("BEGIN IMMEDIATE")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS translations ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, ts INTEGER NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_translations_ts ON translations(ts)")
+            # 条目数由触发器维护，写入时无需 COUNT(*) 全表扫描；旧缓存文件只在首次打开时统计一次
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value INTEGER NOT NULL)"
+            )
+            self._conn.execute(
+                "INSERT OR IGNORE INTO meta (name, value) "
+                "SELECT 'row_count', COUNT(*) FROM translations"
+            )
+            self._conn.execute(
+                "CREATE TRIGGER IF NOT EXISTS translations_count_insert AFTER INSERT ON translations "
+                "BEGIN UPDATE meta SET value = value + 1 WHERE name = 'row_count'; END"
+            )
+            self._conn.execute(
+                "CREATE TRIGGER IF NOT EXISTS translations_count_delete AFTER DELETE ON translations "
+                "BEGIN UPDATE meta SET value = value - 1 WHERE name = 'row_count'; END"
+            )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def make_key(namespace: str, text: str) -> str:
+        """生成缓存键：namespace 区分翻译引擎/模型/提示词，修改任一项都不会命中旧译文"""
+        raw = f"{TRANSLATION_CACHE_VERSION}\x1f{namespace}\x1f{text}"
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """读取单条译文，未命中返回 None"""
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, str]:
+        """批量读取译文，返回 {键: 译文}，先查内存层，未命中的再查 SQLite；所有命中条目的使用时间一次性刷新"""
+        keys = list(keys)
+        found = self._memory_get_many(keys)
+        keys = [key for key in keys if key not in found]
+        
+        stored = {}
+        now = int(time.time())
+        with self._lock:
+            # 分块查询，避免超过 SQLite 的参数个数限制
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT key, value FROM translations WHERE key IN ({placeholders})", chunk
+                ).fetchall()
+                stored.update(rows)
+            # 内存层命中的条目也要刷新 SQLite 中的使用时间，否则热点译文反而最先被淘汰
+            touched = list(found) + list(stored)
+            if touched:
+                try:
+                    self._conn.executemany("UPDATE translations SET ts = ? WHERE key = ?",
+                                           [(now, key) for key in touched])
+                    self._conn.commit()
+                except sqlite3.Error:
+                    # 刷新使用时间只影响淘汰顺序，数据库被锁时放弃本次刷新，不影响读取结果
+                    self._conn.rollback()
+        self._memory_put_many(stored)
+        found.update(stored)
+        return found
+
+    def put(self, key: str, value: str):
+        """写入单条译文"""
+        self.put_many({key: value})
+
+    def put_many(self, items: Dict[str, str]):
+        """批量写入译文，超过容量时淘汰最久未使用的条目"""
+        if not items:
+            return
+        self._memory_put_many(items)
+        now = int(time.time())
+        with self._lock:
+            # 用 UPSERT 而不是 INSERT OR REPLACE：后者隐式删除旧行时不触发删除触发器，会让计数偏大
+            self._conn.executemany(
+                "INSERT INTO translations (key, value, ts) VALUES (?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value, ts = excluded.ts",
+                [(key, value, now) for key, value in items.items()]
+            )
+            count = self._conn.execute("SELECT value FROM meta WHERE name = 'row_count'").fetchone()[0]
+            if count > self.max_entries:
+                self._conn.execute(
+                    "DELETE FROM translations WHERE key IN "
+                    "(SELECT key FROM translations ORDER BY ts ASC LIMIT ?)",
+                    (count - self.max_entries,)
+                )
+            self._conn.commit()
+
+    @classmethod
+    def _memory_get_many(cls, keys) -> Dict[str, str]:
+        """从内存层读取，命中的条目移到最近使用的一端"""
+        found = {}
+        with cls._memory_lock:
+            for key in keys:
+                value = cls._memory.get(key)
+                if value is not None:
+                    cls._memory.move_to_end(key)
+                    found[key] = value
+        return found
+
+    @classmethod
+    def _memory_put_many(cls, items: Dict[str, str]):
+        """写入内存层，超过容量时淘汰最久未使用的条目"""
+        with cls._memory_lock:
+            for key, value in items.items():
+                cls._memory[key] = value
+                cls._memory.move_to_end(key)
+            while len(cls._memory) > MEMORY_MAX_ENTRIES:
+                cls._memory.popitem(last=False)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()